@@ -3,6 +3,7 @@
 
 from flask import Flask, render_template, send_from_directory
 from config import get_config
+from common.json_provider import OrjsonProvider
 import os
 import logging
 import traceback  # 디버깅용 추가
@@ -17,6 +18,9 @@ def create_app():
     config_class = get_config()
     app.config.from_object(config_class)
 
+    # JSON 응답 직렬화 (jsonify 포함) orjson 사용
+    app.json = OrjsonProvider(app)
+
     # 로깅 설정
     logging.basicConfig(
         level=logging.INFO,
@@ -107,5 +111,6 @@ if __name__ == '__main__':
     app.run(
         debug=app.config['DEBUG'],
         host='0.0.0.0',
-        port=5000
+        port=5000,
+        threaded=True  # I/O 대기 중인 요청이 다른 요청을 막지 않도록
     )
\ No newline at end of file
@@ -3,8 +3,7 @@
 
 import pymysql
 import logging
-from flask import current_app
-from typing import List, Dict, Optional
+from typing import List, Dict
 
 
 class DatabaseManager:
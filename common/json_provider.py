@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+orjson 기반 Flask JSON 프로바이더
+- jsonify / app.json.response 직렬화를 orjson으로 처리
+- dataclass, datetime, numpy 타입은 orjson이 직접 변환
+- Decimal, Enum, set은 orjson_default에서 변환
+"""
+
+from decimal import Decimal
+from enum import Enum
+
+import json
+
+import orjson
+from flask.json.provider import JSONProvider
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def orjson_default(obj):
+    """orjson이 기본 지원하지 않는 타입 변환"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f"JSON 직렬화 불가 타입: {type(obj).__name__}")
+
+
+class OrjsonProvider(JSONProvider):
+    """stdlib json 대신 orjson을 사용하는 JSON 프로바이더"""
+
+    mimetype = 'application/json'
+
+    # DefaultJSONProvider와 같은 이름의 설정 (디버그 모드에서도 들여쓰기/키 정렬 없이 compact 출력)
+    compact = True
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=orjson_default, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        # object_hook 등 인자가 있으면 stdlib json으로 처리 (세션 쿠키 TaggedJSONSerializer가 사용)
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """str 변환 없이 orjson 결과 bytes를 그대로 응답 본문으로 사용"""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=orjson_default, option=ORJSON_OPTIONS),
+            mimetype=self.mimetype
+        )
@@ -1,10 +1,20 @@
-from datetime import datetime
+import atexit
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Union
 import logging
 
+# 자주 호출되는 파싱 함수용 정규식 (호출마다 re 캐시 조회 없이 재사용)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_NUMERIC_RE = re.compile(r'[^\d.-]')
+_PERCENT_RE = re.compile(r'([+-]?\d+\.?\d*)%?')
+_STOCK_CODE_RE = re.compile(r'\b(\d{6})\b')
+_STOCK_CODE_ONLY_RE = re.compile(r'^\d{6}$')
+
 def format_datetime(dt):
     """날짜/시간 포맷팅"""
     if dt:
@@ -31,23 +41,38 @@ def clean_text(text: str) -> str:
         return ""
 
     # HTML 태그 제거
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _HTML_TAG_RE.sub('', text)
     # 연속된 공백을 하나로
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     # 앞뒤 공백 제거
     text = text.strip()
 
     return text
 
 
+def _parse_plain_number(text: str) -> Optional[float]:
+    """부호/숫자/소수점만으로 된 문자열이면 float 변환, 아니면 None
+    (float()가 받아들이는 nan, inf, 1e5 같은 표기는 정규식 경로와 결과가 달라 제외)"""
+    if not text.lstrip('+-').replace('.', '', 1).isdigit():
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
 def parse_number(text: str) -> Optional[float]:
     """문자열에서 숫자 추출 (천단위 콤마, % 등 처리)"""
     if not text:
         return None
 
-    # 숫자가 아닌 문자 제거 (콤마, % 제외)
-    clean_num = re.sub(r'[^\d.,-]', '', str(text))
-    clean_num = clean_num.replace(',', '')
+    # 콤마만 있는 일반적인 숫자 문자열은 정규식 없이 바로 변환
+    number = _parse_plain_number(str(text).replace(',', '').strip())
+    if number is not None:
+        return number
+
+    # 숫자, 소수점, 부호 외 문자 제거 (천단위 콤마도 같은 패스에서 제거)
+    clean_num = _NON_NUMERIC_RE.sub('', str(text))
 
     try:
         return float(clean_num)
@@ -60,8 +85,13 @@ def parse_percentage(text: str) -> Optional[float]:
     if not text:
         return None
 
+    # '+3.45%' 같은 일반적인 형태는 정규식 없이 바로 변환
+    number = _parse_plain_number(str(text).strip().rstrip('%'))
+    if number is not None:
+        return number
+
     # % 기호와 함께 숫자 추출
-    match = re.search(r'([+-]?\d+\.?\d*)%?', str(text))
+    match = _PERCENT_RE.search(str(text))
     if match:
         try:
             return float(match.group(1))
@@ -117,24 +147,47 @@ def get_latest_trading_date() -> datetime:
     return today.date()
 
 
-def safe_request(url: str, headers: Dict = None, timeout: int = 30) -> Optional[requests.Response]:
-    """안전한 HTTP 요청"""
-    default_headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
+# 공유 HTTP 세션 (호출마다 새 연결을 맺지 않도록 연결 풀 재사용)
+# 일시적 오류(429/5xx)는 새 요청을 만들지 않고 어댑터에서 짧은 백오프로 재시도
+_http_session = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504))
+)
+_http_session.mount('https://', _http_adapter)
+_http_session.mount('http://', _http_adapter)
+
+
+def close_session():
+    """공유 HTTP 세션의 연결 풀 정리 (프로세스 종료 시 자동 호출, 이후 요청은 새 연결로 처리)"""
+    _http_session.close()
+
+
+atexit.register(close_session)
+
+
+# safe_request 기본 헤더 (요청마다 새로 만들지 않고 공유, 직접 수정 금지)
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
 
-    if headers:
-        default_headers.update(headers)
+def safe_request(url: str, headers: Dict = None, timeout: int = 30) -> Optional[bytes]:
+    """안전한 HTTP 요청 (응답 본문 bytes 반환, str 디코딩은 필요한 호출측에서)"""
+    # 추가 헤더가 있을 때만 합친 사본 생성
+    request_headers = {**_DEFAULT_HEADERS, **headers} if headers else _DEFAULT_HEADERS
 
     try:
-        response = requests.get(
+        # with 블록을 벗어나면 응답을 닫아 연결을 바로 풀로 반환
+        with _http_session.get(
             url,
-            headers=default_headers,
+            headers=request_headers,
             timeout=timeout,
             allow_redirects=True
-        )
-        response.raise_for_status()
-        return response
+        ) as response:
+            response.raise_for_status()
+            return response.content
 
     except requests.exceptions.RequestException as e:
         logging.error(f"HTTP 요청 실패 ({url}): {e}")
@@ -147,7 +200,7 @@ def extract_stock_code(text: str) -> Optional[str]:
         return None
 
     # 6자리 숫자 패턴 찾기
-    match = re.search(r'\b(\d{6})\b', text)
+    match = _STOCK_CODE_RE.search(text)
     if match:
         return match.group(1)
 
@@ -206,7 +259,7 @@ def validate_stock_code(stock_code: str) -> bool:
         return False
 
     # 6자리 숫자인지 확인
-    return bool(re.match(r'^\d{6}$', stock_code))
+    return bool(_STOCK_CODE_ONLY_RE.match(stock_code))
 
 
 def get_news_time_display(news_time: datetime) -> str:
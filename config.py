@@ -40,6 +40,9 @@ class Config:
     # 업로드 설정
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB
 
+    # 등락율상위분석 더미 데이터 모드 (DB/크롤링 없이 화면 테스트)
+    DUMMY_DATA = os.getenv('TOP_RATE_DUMMY_DATA', 'false').lower() == 'true'
+
     # 개발/운영 환경 구분
     ENV = os.getenv('FLASK_ENV', 'development')
     DEBUG = ENV == 'development'
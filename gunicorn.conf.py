@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+gunicorn 설정 (gunicorn wsgi:app 실행 시 자동 로드)
+- 라우트가 DB/크롤링/HTTP 대기 위주이므로 프로세스 수보다 스레드 수로 동시성 확보
+- SSE 진행상황 스트림은 연결당 스레드 하나를 점유하므로 스레드 여유 확보
+- 환경변수로 조정 가능 (GUNICORN_WORKERS, GUNICORN_THREADS, GUNICORN_BIND)
+"""
+
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+
+# 워커 프로세스 수 (진행상황/캐시가 프로세스 메모리에 있으므로 기본 1개)
+# 여러 개로 늘려도 크롤링 자체는 DB 잠금(crawl_lock)으로 프로세스 간 하나만 실행
+workers = int(os.getenv('GUNICORN_WORKERS', 1))
+
+# 스레드 워커: I/O 대기 중에는 GIL이 풀려 다른 요청 처리
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 32))
+
+# gthread 워커는 요청 처리 중에도 heartbeat를 보내므로 긴 SSE 스트림과 무관
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
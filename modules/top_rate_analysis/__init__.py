@@ -12,14 +12,15 @@
 __version__ = '3.0.0'
 __author__ = 'Stock Analysis Team'
 
-from .routes import top_rate_bp
+from .routes import top_rate_bp, top_rate_dev_bp
 from .database import TopRateDatabase
 from .crawler import TopRateCrawler
 from .utils import get_trading_date, clean_text, parse_percentage
-from .scheduler import TopRateScheduler
+from .scheduler import TopRateScheduler, get_scheduler
 
 __all__ = [
     'top_rate_bp',
+    'top_rate_dev_bp',
     'TopRateDatabase',
     'TopRateCrawler',
     'TopRateScheduler',
@@ -35,10 +36,16 @@ def register_module(app):
         # Blueprint 등록
         app.register_blueprint(top_rate_bp, url_prefix='/top-rate')
 
+        # 개발자 도구는 개발 모드에서만 라우트 자체를 등록
+        if app.config.get('DEBUG', False):
+            app.register_blueprint(top_rate_dev_bp, url_prefix='/top-rate')
+            app.logger.info("🛠️ 개발자 도구 라우트 등록 (/top-rate/api/dev/*)")
+
         # 스케줄러 초기화 (선택사항) - 개발 환경에서는 비활성화
         if not app.config.get('DEBUG', False) or app.config.get('ENABLE_SCHEDULER', False):
             try:
-                scheduler = TopRateScheduler()
+                # 전역 인스턴스 사용 (스케줄러/작업 쓰레드 풀이 프로세스당 하나)
+                scheduler = get_scheduler()
                 scheduler.init_app(app)
                 app.logger.info("✅ TopRateScheduler 초기화 완료")
             except Exception as e:
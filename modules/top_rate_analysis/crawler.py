@@ -2,53 +2,628 @@
 # -*- coding: utf-8 -*-
 
 """
-등락율상위분석 모듈 (완전 독립형)
+등락율상위분석 크롤러 (작동하는 paste.txt 기반으로 완전 재작성)
 - 네이버 금융 테마별 상위 종목 크롤링
 - 실시간 진행상황 추적
-- 자동 스케줄링 (오전 8시 기준 날짜 처리)
-- 완전 독립적인 DB 및 API 구조
+- 종목별 뉴스 수집
 """
 
-__version__ = '3.0.0'
-__author__ = 'Stock Analysis Team'
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import time
+import re
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from itertools import chain
+from operator import itemgetter
+from typing import List, Dict, Optional, Callable
+from urllib.parse import urljoin
 
-from .routes import top_rate_bp
 from .database import TopRateDatabase
-from .crawler import TopRateCrawler
-from .utils import get_trading_date, clean_text, parse_percentage
-from .scheduler import TopRateScheduler
-
-__all__ = [
-    'top_rate_bp',
-    'TopRateDatabase',
-    'TopRateCrawler',
-    'TopRateScheduler',
-    'get_trading_date',
-    'clean_text',
-    'parse_percentage'
-]
-
-
-def register_module(app):
-    """Flask 앱에 등락율상위분석 모듈 등록"""
-    try:
-        # Blueprint 등록
-        app.register_blueprint(top_rate_bp, url_prefix='/top-rate')
-
-        # 스케줄러 초기화 (선택사항) - 개발 환경에서는 비활성화
-        if not app.config.get('DEBUG', False) or app.config.get('ENABLE_SCHEDULER', False):
+from .utils import get_trading_date
+
+
+def _create_http_session() -> requests.Session:
+    """네이버 요청용 공유 세션 (연결 재사용 + 일시 오류 재시도)"""
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    })
+
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# 크롤러 인스턴스/작업 쓰레드가 함께 사용 (TCP/TLS 연결을 크롤링 간에도 재사용)
+_http_session = _create_http_session()
+
+# 파싱 정규식 (행/셀마다 다시 만들지 않도록 모듈 로드 시 한 번만 컴파일)
+_THEME_NO_RE = re.compile(r'no=(\d+)')
+_STOCK_LINK_RE = re.compile(r'/item/main\.naver\?code=\d{6}')
+_STOCK_CODE_RE = re.compile(r'code=(\d{6})')
+_PERCENT_RE = re.compile(r'([+-]?\d+\.?\d*)%?')
+_NEWS_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})')
+
+# 결과 dict 필드 접근자 (집계 시 람다/제너레이터 프레임 없이 map에 사용)
+_get_stocks = itemgetter('stocks')
+_get_news = itemgetter('news')
+
+# _clean_text에서 지우는 문자 (replace 네 번 대신 translate 한 번)
+_CLEAN_TEXT_TABLE = str.maketrans('', '', '\n\t\xa0,')
+
+
+class _RateLimiter:
+    """작업 쓰레드 공유 요청 속도 제한 (period당 max_calls, 대기는 락 밖에서)"""
+
+    def __init__(self, max_calls: int, period: float = 1.0):
+        self.interval = period / max_calls
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        """다음 요청 순번을 예약하고 그 시각까지 대기"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class TopRateCrawler:
+    """등락율상위분석 크롤러 (작동 검증된 코드 기반)"""
+
+    def __init__(self, progress_callback: Optional[Callable] = None):
+        """크롤러 초기화"""
+        self.session = _http_session
+
+        self.db = TopRateDatabase()
+        self.progress_callback = progress_callback
+
+        # 크롤링 설정
+        self.max_stocks_per_theme = 5  # 테마당 최대 종목 수
+        self.news_per_stock = 5  # 종목당 뉴스 수
+        self.max_workers = 4  # 동시에 처리할 테마 수
+        self.news_workers = 5  # 테마 안에서 동시에 뉴스를 수집할 종목 수
+        # 네이버 요청 제한: 쓰레드별 고정 sleep 대신 전체 초당 요청 수로 제한
+        self.rate_limiter = _RateLimiter(max_calls=5, period=1.0)
+
+        # 크롤링 1회 동안 종목별 뉴스 수집 결과 (여러 테마에 속한 종목은 한 번만 요청)
+        self._news_futures: Dict[str, Future] = {}
+        self._news_lock = threading.Lock()
+
+    def crawl_and_save(self, target_date: Optional[str] = None) -> bool:
+        """전체 크롤링 및 저장 프로세스"""
+        start_time = datetime.now()
+
+        if target_date is None:
+            target_date = get_trading_date()
+
+        logging.info(f"🚀 등락율상위분석 크롤링 시작 (날짜: {target_date})")
+
+        try:
+            with self._news_lock:
+                self._news_futures = {}
+
+            # 1단계: 데이터베이스 설정
+            self._update_progress(5, "데이터베이스 설정 중...")
+            self.db.setup_crawling_database()
+            table_name = self.db.setup_theme_table(target_date)
+
+            # 2단계: 테마 리스트 크롤링
+            self._update_progress(10, "테마 리스트 크롤링 중...")
+            themes = self._get_theme_list()
+
+            if not themes:
+                logging.error("❌ 크롤링할 테마가 없습니다")
+                return False
+
+            logging.info(f"✅ {len(themes)}개 상승 테마 발견")
+
+            # 3단계: 테마별 데이터 수집 (테마 단위 병렬 처리)
+            theme_results = [None] * len(themes)
+            total_themes = len(themes)
+            completed = 0
+
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='theme-crawl') as executor:
+                futures = {
+                    executor.submit(self._process_theme_safely, i, theme, total_themes): i
+                    for i, theme in enumerate(themes)
+                }
+
+                for future in as_completed(futures):
+                    i = futures[future]
+                    theme_results[i] = future.result()
+                    completed += 1
+
+                    # 진행상황 업데이트
+                    progress = 15 + (70 * completed / total_themes)  # 15% ~ 85%
+                    message = f"{themes[i]['name']} 테마 분석 완료 ({completed}/{total_themes})"
+                    self._update_progress(progress, message)
+
+            # 원래 테마 순서대로 결과 구성 (종목의 대표 테마 순서 유지)
+            result = {
+                theme['name']: theme_data
+                for theme, theme_data in zip(themes, theme_results)
+                if theme_data
+            }
+            del theme_results, futures
+
+            if not result:
+                logging.error("❌ 크롤링된 데이터가 없습니다")
+                return False
+
+            # 4단계: 데이터베이스 저장
+            self._update_progress(90, "데이터베이스 저장 중...")
+
+            # 데이터 변환 (기존 DB 저장 형식에 맞게)
+            # 요약 수치만 남기고 테마별 원본은 저장 전에 해제 (저장 중 두 벌이 메모리에 남지 않도록)
+            summary = self._summarize(result)
+            converted_data = self._convert_data_format(result)
+            del result
+            success = self.db.save_theme_data(table_name, converted_data)
+            del converted_data
+
+            if success:
+                self._update_progress(100, "크롤링 완료!")
+                self._print_summary(summary, target_date)
+
+                end_time = datetime.now()
+                duration = (end_time - start_time).total_seconds()
+                logging.info(f"⚡ 전체 크롤링 완료: {duration:.1f}초 소요")
+
+                return True
+            else:
+                logging.error("❌ 데이터베이스 저장 실패")
+                return False
+
+        except Exception as e:
+            logging.error(f"❌ 크롤링 프로세스 실패: {e}")
+            return False
+
+        finally:
+            # 크롤러는 재사용되므로 이번 크롤링의 뉴스 결과를 다음 실행까지 들고 있지 않음
+            with self._news_lock:
+                self._news_futures = {}
+
+    def _get_theme_list(self) -> List[Dict]:
+        """테마 리스트 크롤링 (작동 검증된 코드)"""
+        url = "https://finance.naver.com/sise/theme.naver"
+
+        try:
+            response = self.session.get(url, timeout=10)
+            response.encoding = 'euc-kr'
+            soup = BeautifulSoup(response.text, 'lxml')
+
+            table = soup.find('table', {'class': 'type_1'})
+            if not table:
+                return []
+
+            themes = []
+            rows = table.find_all('tr')[1:]  # 헤더 제외
+
+            for row in rows:
+                try:
+                    cols = row.find_all('td', recursive=False)  # td는 tr의 직계 자식 (하위 트리 전체 탐색 생략)
+                    if len(cols) < 4:
+                        continue
+
+                    theme_link = cols[0].find('a')
+                    if not theme_link:
+                        continue
+
+                    theme_name = self._clean_text(theme_link.text)
+                    theme_url = theme_link.get('href', '')
+                    theme_code_match = _THEME_NO_RE.search(theme_url)
+                    theme_code = theme_code_match.group(1) if theme_code_match else ""
+                    change_rate = self._parse_percentage(cols[3].text)
+
+                    if theme_name and theme_code and change_rate > 0:
+                        themes.append({
+                            'name': theme_name,
+                            'code': theme_code,
+                            'change_rate': change_rate,
+                            'url': f"https://finance.naver.com{theme_url}"
+                        })
+
+                except Exception:
+                    continue
+
+            return themes
+
+        except Exception as e:
+            logging.error(f"테마 리스트 크롤링 실패: {e}")
+            return []
+
+    def _process_theme_safely(self, index: int, theme: Dict, total_themes: int) -> Optional[Dict]:
+        """작업 쓰레드용 테마 처리 (예외는 로그만 남기고 None 반환)"""
+        try:
+            logging.info(f"[{index + 1}/{total_themes}] {theme['name']} (+{theme['change_rate']}%) 처리 중...")
+
+            # 테마별 종목 + 뉴스 수집
+            theme_data = self._process_theme(theme)
+
+            if theme_data:
+                stocks_count = len(theme_data['stocks'])
+                total_news = sum(map(len, map(_get_news, theme_data['stocks'])))
+                logging.info(f"    ✅ {theme['name']} 완료: {stocks_count}개 종목, {total_news}개 뉴스")
+            else:
+                logging.warning(f"    ❌ {theme['name']}: 데이터 수집 실패")
+
+            return theme_data
+
+        except Exception as e:
+            logging.error(f"    ❌ {theme['name']} 처리 실패: {e}")
+            return None
+
+    def _process_theme(self, theme: Dict) -> Optional[Dict]:
+        """테마별 종목 + 뉴스 처리 (작동 검증된 코드)"""
+        theme_name = theme['name']
+        theme_code = theme['code']
+
+        # 종목 정보 수집
+        top_stocks, all_theme_stocks = self._get_theme_stocks(theme_code, theme_name)
+        if not top_stocks:
+            return None
+
+        # 뉴스 수집 (종목별 요청은 서로 독립이므로 동시에 보내고 순서는 map으로 유지)
+        logging.info(f"       {theme_name}: {len(top_stocks)}개 종목 뉴스 수집...")
+        with ThreadPoolExecutor(max_workers=self.news_workers, thread_name_prefix='news-crawl') as executor:
+            news_results = list(executor.map(
+                lambda stock: self._get_stock_news_once(stock['code'], stock['name']),
+                top_stocks
+            ))
+
+        stocks_with_news = [
+            {**stock, 'news': stock_news}
+            for stock, stock_news in zip(top_stocks, news_results)
+        ]
+
+        return {
+            'theme_info': {
+                'code': theme_code,
+                'change_rate': theme['change_rate']
+            },
+            'stocks': stocks_with_news,
+            'theme_stocks': all_theme_stocks
+        }
+
+    def _get_theme_stocks(self, theme_code: str, theme_name: str) -> tuple:
+        """테마별 종목 수집 (작동 검증된 코드)"""
+        url = f"https://finance.naver.com/sise/sise_group_detail.naver?type=theme&no={theme_code}"
+
+        try:
+            self.rate_limiter.wait()
+            response = self.session.get(url, timeout=15)
+            response.encoding = 'euc-kr'
+            soup = BeautifulSoup(response.text, 'lxml')
+
+            stock_links = soup.find_all('a', href=_STOCK_LINK_RE)
+            if not stock_links:
+                return [], []
+
+            all_theme_stocks = []
+            top_stocks = []
+            processed_codes = set()
+
+            for link in stock_links:
+                try:
+                    href = link.get('href', '')
+                    code_match = _STOCK_CODE_RE.search(href)
+                    if not code_match:
+                        continue
+
+                    stock_code = code_match.group(1)
+                    if stock_code in processed_codes:
+                        continue
+                    processed_codes.add(stock_code)
+
+                    stock_name = self._clean_text(link.text)
+                    if not stock_name or len(stock_name) < 2:
+                        continue
+
+                    # 가격/등락률/거래량 추출
+                    row = link.find_parent('tr')
+                    current_price = 0
+                    change_rate = 0
+                    volume = 0
+
+                    if row:
+                        cells = row.find_all('td', recursive=False)
+                        for cell in cells:
+                            cell_text = self._clean_text(cell.text)
+
+                            # 등락률 (% 포함)
+                            if '%' in cell_text:
+                                rate = self._parse_percentage(cell_text)
+                                if abs(rate) < 100:
+                                    change_rate = rate
+                                continue
+
+                            if not cell_text.isdigit():
+                                continue
+                            number = int(cell_text)  # 셀당 한 번만 변환
+
+                            # 가격 (1000 이상 숫자)
+                            if number >= 1000 and current_price == 0:
+                                current_price = number
+
+                            # 거래량 (큰 숫자)
+                            if number > 10000 and number > volume:
+                                volume = number
+
+                    stock_info = {
+                        'code': stock_code,
+                        'name': stock_name,
+                        'price': current_price,
+                        'change_rate': change_rate,
+                        'volume': volume
+                    }
+
+                    all_theme_stocks.append(stock_info)
+
+                    # 상위 종목만 따로 저장
+                    if len(top_stocks) < self.max_stocks_per_theme:
+                        top_stocks.append(stock_info)
+
+                except Exception:
+                    continue
+
+            return top_stocks, all_theme_stocks
+
+        except Exception as e:
+            logging.error(f"테마 종목 수집 실패 ({theme_name}): {e}")
+            return [], []
+
+    def _get_stock_news_once(self, stock_code: str, stock_name: str) -> List[Dict]:
+        """종목 뉴스 수집 (같은 크롤링 안에서는 다른 테마 작업 쓰레드가 받은 결과 재사용)"""
+        with self._news_lock:
+            future = self._news_futures.get(stock_code)
+            is_owner = future is None
+            if is_owner:
+                future = self._news_futures[stock_code] = Future()
+
+        if is_owner:
             try:
-                scheduler = TopRateScheduler()
-                scheduler.init_app(app)
-                app.logger.info("✅ TopRateScheduler 초기화 완료")
+                future.set_result(self._get_stock_news(stock_code, stock_name))
             except Exception as e:
-                app.logger.warning(f"⚠️ TopRateScheduler 초기화 실패: {e}")
+                logging.warning(f"뉴스 수집 실패 ({stock_name}): {e}")
+                future.set_result([])
         else:
-            app.logger.info("ℹ️ 개발 모드: TopRateScheduler 비활성화")
+            logging.info(f"       ♻️ {stock_name} 뉴스 재사용 (다른 테마에서 수집)")
+
+        return future.result()
+
+    def _get_stock_news(self, stock_code: str, stock_name: str) -> List[Dict]:
+        """종목별 뉴스 수집 (작동 검증된 코드)"""
+        url = f"https://finance.naver.com/item/news_news.naver?code={stock_code}&page=1&sm=title_entity_id.basic&clusterId="
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Referer': f'https://finance.naver.com/item/main.naver?code={stock_code}'
+        }
+
+        try:
+            self.rate_limiter.wait()
+            response = self.session.get(url, headers=headers, timeout=10)
+            response.encoding = 'euc-kr'
+            soup = BeautifulSoup(response.text, 'lxml')
+
+            news_table = soup.find('table', {'class': 'type5'})
+            if not news_table:
+                return []
+
+            news_list = []
+            rows = news_table.find_all('tr')
+
+            current_date = None
+            today = datetime.now().date()
+            yesterday = today - timedelta(days=1)
+
+            for row in rows:
+                try:
+                    # 날짜 헤더 처리
+                    # 행의 셀은 직계 자식만 조회, 날짜 셀은 아래 시간 추출에서도 재사용
+                    date_cell = row.find('td', {'class': 'date'}, recursive=False)
+                    if date_cell and date_cell.get('colspan'):
+                        date_text = self._clean_text(date_cell.text)
+                        current_date = self._parse_news_date(date_text)
+                        continue
+
+                    # 뉴스 제목 추출
+                    title_cell = row.find('td', {'class': 'title'}, recursive=False)
+                    if not title_cell:
+                        continue
+
+                    news_link = title_cell.find('a')
+                    if not news_link:
+                        continue
+
+                    title = self._clean_text(news_link.text)
+                    if not title:
+                        continue
+
+                    news_url = news_link.get('href', '')
+                    if news_url and not news_url.startswith('http'):
+                        news_url = urljoin('https://finance.naver.com', news_url)
+
+                    # 출처 추출
+                    source_cell = row.find('td', {'class': 'info'}, recursive=False)
+                    source = self._clean_text(source_cell.text) if source_cell else ""
+
+                    # 시간 추출 (colspan 날짜 헤더 행은 위에서 건너뛰었으므로 date_cell이 곧 시간 셀)
+                    news_time = current_date
+                    if date_cell:
+                        time_text = self._clean_text(date_cell.text)
+                        news_time = self._parse_news_time(time_text, current_date)
+
+                    # 당일/전일 뉴스만 수집
+                    if news_time and (news_time.date() == today or news_time.date() == yesterday):
+                        news_data = {
+                            'title': title,
+                            'url': news_url,
+                            'source': source,
+                            'time': news_time.strftime('%Y-%m-%d %H:%M') if news_time else '',
+                            'is_today': news_time.date() == today if news_time else False
+                        }
+
+                        news_list.append(news_data)
+
+                        if len(news_list) >= self.news_per_stock:
+                            break
+
+                except Exception:
+                    continue
+
+            return news_list
+
+        except Exception as e:
+            logging.warning(f"뉴스 수집 실패 ({stock_name}): {e}")
+            return []
+
+    def _convert_data_format(self, result: Dict) -> List[Dict]:
+        """크롤링 결과를 DB 저장 형식으로 변환"""
+        # 종목별로 데이터 정리 (중복 제거)
+        stock_data = {}
+
+        for theme_name, theme_data in result.items():
+            theme_stocks = theme_data['theme_stocks']
+            for stock in theme_data['stocks']:
+                entry = stock_data.get(stock['code'])
+                if entry is None:
+                    entry = stock_data[stock['code']] = {
+                        'stock_code': stock['code'],
+                        'stock_name': stock['name'],
+                        'themes': [],
+                        'price': stock['price'],
+                        'change_rate': stock['change_rate'],
+                        'volume': stock['volume'],
+                        'news': stock['news'],
+                        'theme_stocks': {}
+                    }
+
+                # 테마별 종목 정보 추가 (같은 테마는 키가 덮어써지므로 중복 없음)
+                entry['theme_stocks'][theme_name] = theme_stocks
+
+        # 테마 목록은 theme_stocks 키 순서(처음 추가된 순서)와 동일 - 리스트 중복 검사 없이 한 번에 생성
+        for entry in stock_data.values():
+            entry['themes'] = list(entry['theme_stocks'])
+
+        # 리스트로 변환
+        return list(stock_data.values())
+
+    def _update_progress(self, percent: float, message: str):
+        """진행상황 업데이트"""
+        if self.progress_callback:
+            self.progress_callback(percent, message)
+        logging.info(f"🔄 [{percent:.1f}%] {message}")
+
+    def _summarize(self, result: Dict) -> Dict[str, int]:
+        """크롤링 결과 요약 수치 (테마/종목/뉴스 수)"""
+        # 테마별 종목 리스트를 이어 붙여 한 번에 집계 (종목 수/뉴스 수 모두 C 수준 reduce)
+        stocks = list(chain.from_iterable(map(_get_stocks, result.values())))
+        return {
+            'total_themes': len(result),
+            'total_stocks': len(stocks),
+            'total_news': sum(map(len, map(_get_news, stocks)))
+        }
+
+    def _print_summary(self, summary: Dict[str, int], target_date: str):
+        """크롤링 결과 요약 출력"""
+        total_themes = summary['total_themes']
+        total_stocks = summary['total_stocks']
+        total_news = summary['total_news']
+
+        logging.info(f"""
+🎯 크롤링 결과 요약 ({target_date})
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📊 총 테마: {total_themes}개
+📈 총 종목: {total_stocks}개  
+📰 총 뉴스: {total_news}개
+⚡ 평균 뉴스/종목: {total_news / total_stocks:.1f}개
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━""")
+
+    # 유틸리티 함수들 (작동 검증된 코드)
+    def _clean_text(self, text):
+        """텍스트 정리"""
+        if not text:
+            return ""
+        return text.strip().translate(_CLEAN_TEXT_TABLE)
+
+    def _parse_percentage(self, text):
+        """퍼센트 파싱"""
+        if not text:
+            return 0
+        # 대부분의 셀은 '+3.45%' 형태라 정규식 없이 바로 변환 (nan, inf, 지수 표기는 정규식 경로로)
+        number_text = str(text).strip().rstrip('%')
+        if number_text.lstrip('+-').replace('.', '', 1).isdigit():
+            try:
+                return float(number_text)
+            except ValueError:
+                pass
+        try:
+            match = _PERCENT_RE.search(str(text))
+            if match:
+                return float(match.group(1))
+            return 0
+        except:
+            return 0
+
+    def _parse_news_date(self, date_text):
+        """뉴스 날짜 파싱"""
+        try:
+            if '.' in date_text:
+                date_parts = date_text.split('.')
+                if len(date_parts) == 3:
+                    year = int(date_parts[0])
+                    month = int(date_parts[1])
+                    day = int(date_parts[2])
+                    return datetime(year, month, day)
+
+            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+            if '오늘' in date_text:
+                return today
+            elif '어제' in date_text:
+                return today - timedelta(days=1)
+
+            return today
+        except:
+            return datetime.now()
+
+    def _parse_news_time(self, time_text, base_date):
+        """뉴스 시간 파싱"""
+        try:
+            if not base_date:
+                base_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+            time_match = _NEWS_TIME_RE.search(time_text)
+            if time_match:
+                hour = int(time_match.group(1))
+                minute = int(time_match.group(2))
+                return base_date.replace(hour=hour, minute=minute)
+
+            return base_date
+        except:
+            return base_date
 
-        app.logger.info("✅ 등락율상위분석 모듈 등록 완료 (독립형 v3.0)")
-        return True
 
-    except Exception as e:
-        app.logger.error(f"❌ 등락율상위분석 모듈 등록 실패: {e}")
-        return False
\ No newline at end of file
+# 진행상황 추적을 위한 전역 변수 (웹 인터페이스용)
+crawling_progress = {
+    'is_running': False,
+    'percent': 0,
+    'message': '',
+    'start_time': None,
+    'end_time': None,
+    'success': None,
+    'error_message': ''
+}
\ No newline at end of file
@@ -10,16 +10,116 @@
 """
 
 import pymysql
-import json
+import orjson
 import logging
+import threading
+import heapq
+from collections import defaultdict
+from itertools import chain
+from bisect import bisect_right
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Iterator, Tuple
 import os
+import tempfile
 from dotenv import load_dotenv
+from sqlalchemy.pool import QueuePool
+
+from .utils import now_str, get_theme_icon, get_table_name
 
 # .env 파일 로드
 load_dotenv()
 
+# DB별 연결 풀 (프로세스 전역, 모든 TopRateDatabase 인스턴스가 공유)
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 5))
+DB_POOL_MAX_OVERFLOW = int(os.getenv('DB_POOL_MAX_OVERFLOW', 20))
+DB_POOL_RECYCLE = 3600  # MySQL wait_timeout 전에 오래된 연결 교체
+
+_pools: Dict[Optional[str], QueuePool] = {}
+_pools_lock = threading.Lock()
+
+# MySQL 오류 코드: 테이블 없음
+ER_NO_SUCH_TABLE = 1146
+
+# 크롤링 실행 잠금 이름 (gunicorn 워커/스케줄러가 여러 프로세스여도 동시에 하나만 실행)
+CRAWL_LOCK_NAME = 'top_rate_crawl'
+
+# 테마 강도 기준표 (평균 등락률/상승 비율이 모두 해당 단계 기준 이상이어야 함)
+_STRENGTH_CHANGE_THRESHOLDS = (1.0, 3.0, 5.0)
+_STRENGTH_RATIO_THRESHOLDS = (60, 70, 80)
+_STRENGTH_GRADES = ('WEAK', 'NORMAL', 'STRONG', 'HOT')
+
+# SQL 집계용 강도 분류식도 같은 기준표에서 생성 (높은 단계부터 검사)
+_STRENGTH_ORDER = _STRENGTH_GRADES[::-1]
+_STRENGTH_CASE_SQL = 'CASE {} ELSE {!r} END'.format(
+    ' '.join(
+        f"WHEN avg_change_rate >= {change} AND positive_stocks * 100 / stock_count >= {ratio} THEN {grade!r}"
+        for change, ratio, grade in reversed(list(zip(
+            _STRENGTH_CHANGE_THRESHOLDS, _STRENGTH_RATIO_THRESHOLDS, _STRENGTH_GRADES[1:]
+        )))
+    ),
+    _STRENGTH_GRADES[0]
+)
+_STRENGTH_SUM_SQL = ',\n                '.join(f"SUM(strength = {grade!r})" for grade in _STRENGTH_ORDER)
+
+
+@dataclass(slots=True, frozen=True)
+class ThemeStock:
+    """테마 상세의 종목 행 (캐시에 오래 남으므로 __dict__ 없는 slots 클래스, orjson이 그대로 직렬화)"""
+    rank: int
+    stock_code: str
+    stock_name: str
+    current_price: int
+    change_rate: float
+    volume: int
+    news_count: int
+    theme_stock_count: int
+
+
+@dataclass(slots=True, frozen=True)
+class ThemeResult:
+    """테마별 분석 결과 행 (고정 스키마, orjson이 필드 순서대로 바로 직렬화)"""
+    rank: int
+    theme_name: str
+    icon: str
+    stock_count: int
+    avg_change_rate: float
+    positive_stocks: int
+    positive_ratio: float
+    total_volume: int
+    avg_news_count: float
+    strength: str
+    date: str
+
+
+# 이 행 수를 넘으면 LOAD DATA LOCAL INFILE로 적재
+BULK_LOAD_THRESHOLD = 5000
+
+
+def _dumps_or_none(value) -> Optional[str]:
+    """JSON 컬럼 값 직렬화 (빈 리스트/딕셔너리는 NULL)"""
+    if not value:
+        return None
+    return orjson.dumps(value).decode()
+
+
+def _tsv_field(value) -> str:
+    """LOAD DATA용 TSV 필드 변환 (NULL은 \\N, 구분자는 이스케이프)"""
+    if value is None:
+        return '\\N'
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+
+
+def _load_json_column(value, default):
+    """JSON 컬럼 파싱 (빈 값/깨진 값은 기본값)"""
+    if not value:
+        return default
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return default
+
 
 class TopRateDatabase:
     """실제 작동하는 등락율상위분석 데이터베이스 (paste.txt 기반)"""
@@ -41,19 +141,55 @@ class TopRateDatabase:
         logging.info("🗄️ TopRateDatabase 초기화 완료 (실제 DB 모드)")
 
     def get_connection(self, database: str = None) -> pymysql.Connection:
-        """DB 연결 생성 (paste.txt get_db_connection 함수 기반)"""
+        """DB 연결 획득 (연결 풀에서 대여, close() 시 풀로 반환)"""
         try:
-            config = self.db_config.copy()
-            if database:
-                config['database'] = database
-
-            connection = pymysql.connect(**config)
-            return connection
+            return self._get_pool(database).connect()
 
         except Exception as e:
             logging.error(f"❌ DB 연결 실패: {e}")
             raise
 
+    @contextmanager
+    def crawl_lock(self, timeout: int = 0) -> Iterator[bool]:
+        """프로세스 간 크롤링 잠금 (MySQL GET_LOCK, 획득 여부를 반환하고 블록 종료 시 해제)"""
+        connection = self.get_connection(self.crawling_db)
+        cursor = connection.cursor()
+        try:
+            # 잠금은 연결에 묶이므로 크롤링이 끝날 때까지 같은 연결 유지
+            cursor.execute("SELECT GET_LOCK(%s, %s)", (CRAWL_LOCK_NAME, timeout))
+            acquired = cursor.fetchone()[0] == 1
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    cursor.execute("SELECT RELEASE_LOCK(%s)", (CRAWL_LOCK_NAME,))
+        finally:
+            cursor.close()
+            connection.close()
+
+    def _get_pool(self, database: Optional[str]) -> QueuePool:
+        """DB별 연결 풀 조회 (최초 요청 시 생성)"""
+        pool = _pools.get(database)
+        if pool is not None:
+            return pool
+
+        with _pools_lock:
+            pool = _pools.get(database)
+            if pool is None:
+                config = self.db_config.copy()
+                if database:
+                    config['database'] = database
+
+                pool = QueuePool(
+                    lambda: pymysql.connect(**config),
+                    pool_size=DB_POOL_SIZE,
+                    max_overflow=DB_POOL_MAX_OVERFLOW,
+                    recycle=DB_POOL_RECYCLE
+                )
+                _pools[database] = pool
+                logging.info(f"🔌 DB 연결 풀 생성: {database or '(기본)'} (size={DB_POOL_SIZE})")
+            return pool
+
     def setup_crawling_database(self) -> bool:
         """crawling_db 스키마 설정 (paste.txt setup_database 함수 기반)"""
         try:
@@ -74,6 +210,175 @@ class TopRateDatabase:
             logging.error(f"❌ crawling_db 설정 실패: {e}")
             return False
 
+    def setup_theme_table(self, date_str: str) -> str:
+        """
+        날짜별 테마 테이블 생성 (기존 테이블 덮어쓰기)
+
+        Args:
+            date_str: YYYY-MM-DD 형식의 날짜
+
+        Returns:
+            생성된 테이블명
+        """
+        table_name = get_table_name(date_str)
+
+        try:
+            connection = self.get_connection(self.crawling_db)
+            cursor = connection.cursor()
+
+            # 기존 테이블 삭제 (덮어쓰기)
+            cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
+
+            # 새 테이블 생성
+            create_sql = f"""
+            CREATE TABLE {table_name} (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                stock_code VARCHAR(10) NOT NULL,
+                stock_name VARCHAR(100) NOT NULL,
+                price INT DEFAULT 0,
+                change_rate DECIMAL(5,2) DEFAULT 0.00,
+                volume BIGINT DEFAULT 0,
+                themes JSON NULL,
+                news JSON NULL,
+                theme_stocks JSON NULL,
+                crawled_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                INDEX idx_stock_code (stock_code),
+                INDEX idx_change_rate (change_rate),
+                INDEX idx_crawled_at (crawled_at)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+            """
+
+            cursor.execute(create_sql)
+            cursor.close()
+            connection.close()
+
+            logging.info(f"✅ 테마 테이블 생성 완료: {table_name}")
+            return table_name
+
+        except Exception as e:
+            logging.error(f"❌ 테마 테이블 생성 실패: {e}")
+            raise
+
+    def save_theme_data(self, table_name: str, theme_data: List[Dict]) -> bool:
+        """
+        테마 크롤링 데이터 저장
+
+        Args:
+            table_name: 저장할 테이블명
+            theme_data: 저장할 테마 데이터 리스트
+
+        Returns:
+            저장 성공 여부
+        """
+        if not theme_data:
+            logging.warning("저장할 테마 데이터가 없습니다")
+            return False
+
+        try:
+            # JSON 컬럼은 컬럼 단위로 한 번에 직렬화 (orjson은 UTF-8 그대로 출력)
+            codes = [data.get('stock_code', '') for data in theme_data]
+            names = [data.get('stock_name', '') for data in theme_data]
+            prices = [data.get('price', 0) for data in theme_data]
+            rates = [data.get('change_rate', 0.0) for data in theme_data]
+            vols = [data.get('volume', 0) for data in theme_data]
+            # 비어 있는 값은 직렬화하지 않고 NULL로 저장
+            themes_blobs = [_dumps_or_none(data.get('themes')) for data in theme_data]
+            news_blobs = [_dumps_or_none(data.get('news')) for data in theme_data]
+            theme_stocks_blobs = [_dumps_or_none(data.get('theme_stocks')) for data in theme_data]
+
+            rows = list(zip(codes, names, prices, rates, vols, themes_blobs, news_blobs, theme_stocks_blobs))
+
+            # 대량 데이터는 LOAD DATA LOCAL INFILE로 적재 (실패 시 INSERT로 진행)
+            if len(rows) > BULK_LOAD_THRESHOLD and self._bulk_load_rows(table_name, rows):
+                logging.info(f"✅ 테마 데이터 대량 적재 완료: {len(rows)}개")
+                return True
+
+            connection = self.get_connection(self.crawling_db)
+            cursor = connection.cursor()
+
+            insert_sql = f"""
+            INSERT INTO {table_name} 
+            (stock_code, stock_name, price, change_rate, volume, themes, news, theme_stocks)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            """
+
+            try:
+                # 일괄 저장 (pymysql이 multi-row INSERT로 변환)
+                cursor.executemany(insert_sql, rows)
+                success_count = len(rows)
+
+            except Exception as e:
+                # 일괄 저장 실패 시 개별 저장으로 재시도
+                logging.warning(f"일괄 저장 실패, 개별 저장으로 재시도: {e}")
+                success_count = 0
+
+                for row in rows:
+                    try:
+                        cursor.execute(insert_sql, row)
+                        success_count += 1
+
+                    except Exception as e:
+                        logging.error(f"개별 데이터 저장 실패 ({row[1] or 'Unknown'}): {e}")
+                        continue
+
+            cursor.close()
+            connection.close()
+
+            logging.info(f"✅ 테마 데이터 저장 완료: {success_count}/{len(theme_data)}개")
+            return success_count > 0
+
+        except Exception as e:
+            logging.error(f"❌ 테마 데이터 저장 실패: {e}")
+            return False
+
+    def _bulk_load_rows(self, table_name: str, rows: List[Tuple]) -> bool:
+        """
+        LOAD DATA LOCAL INFILE로 대량 적재
+
+        Args:
+            table_name: 저장할 테이블명
+            rows: save_theme_data 컬럼 순서의 행 튜플 리스트
+
+        Returns:
+            적재 성공 여부
+        """
+        tsv_path = None
+        connection = None
+
+        try:
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.tsv', delete=False) as tsv_file:
+                tsv_path = tsv_file.name
+                for row in rows:
+                    tsv_file.write('\t'.join(_tsv_field(value) for value in row))
+                    tsv_file.write('\n')
+
+            config = self.db_config.copy()
+            config['database'] = self.crawling_db
+            config['local_infile'] = True
+            connection = pymysql.connect(**config)
+
+            with connection.cursor() as cursor:
+                cursor.execute(f"""
+                LOAD DATA LOCAL INFILE %s INTO TABLE {table_name}
+                CHARACTER SET utf8mb4
+                FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'
+                LINES TERMINATED BY '\\n'
+                (stock_code, stock_name, price, change_rate, volume, themes, news, theme_stocks)
+                """, (tsv_path,))
+
+            return True
+
+        except Exception as e:
+            logging.warning(f"대량 적재 실패, INSERT로 재시도: {e}")
+            return False
+
+        finally:
+            # 적재 실패(INSERT 재시도 경로)에서도 local_infile 연결이 남지 않도록 항상 정리
+            if connection:
+                connection.close()
+            if tsv_path:
+                os.remove(tsv_path)
+
     def get_available_dates(self) -> List[str]:
         """수집된 데이터가 있는 날짜 목록 조회 (실제 테이블 기반)"""
         try:
@@ -87,20 +392,12 @@ class TopRateDatabase:
             cursor.close()
             connection.close()
 
-            # 테이블명에서 날짜 추출
-            dates = []
-            for (table_name,) in tables:
-                if table_name.startswith('theme_') and len(table_name) == 14:  # theme_YYYYMMDD
-                    date_part = table_name[6:]  # YYYYMMDD
-                    try:
-                        # YYYY-MM-DD 형식으로 변환
-                        formatted_date = f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:8]}"
-                        dates.append(formatted_date)
-                    except:
-                        continue
-
-            # 최신 순으로 정렬
-            dates.sort(reverse=True)
+            # 테이블명(theme_YYYYMMDD)에서 날짜 추출 → YYYY-MM-DD, 최신 순
+            dates = sorted(
+                (f"{name[6:10]}-{name[10:12]}-{name[12:14]}"
+                 for (name,) in tables if len(name) == 14 and name.startswith('theme_')),
+                reverse=True
+            )
             logging.info(f"📅 사용 가능한 날짜: {len(dates)}개 ({dates[:3]}...)")
             return dates
 
@@ -109,75 +406,93 @@ class TopRateDatabase:
             return []
 
     def has_data_for_date(self, date_str: str) -> bool:
-        """특정 날짜의 데이터 존재 여부 확인 (실제 테이블 기반)"""
-        try:
-            clean_date = date_str.replace('-', '')
-            table_name = f"theme_{clean_date}"
+        """특정 날짜의 데이터 존재 여부 확인 (테이블 존재/데이터 유무를 쿼리 한 번으로 확인)"""
+        clean_date = date_str.replace('-', '')
+        if len(clean_date) != 8 or not (clean_date.isascii() and clean_date.isdigit()):
+            return False
+        table_name = f"theme_{clean_date}"
 
+        connection = None
+        try:
             connection = self.get_connection(self.crawling_db)
             cursor = connection.cursor()
 
-            # 테이블 존재 확인
-            cursor.execute(f"SHOW TABLES LIKE '{table_name}'")
-            table_exists = cursor.fetchone()
-
-            if not table_exists:
-                cursor.close()
-                connection.close()
-                return False
-
-            # 데이터 존재 확인
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            count = cursor.fetchone()[0]
-
+            # SHOW TABLES + COUNT(*) 두 번 왕복 대신 행 하나만 조회 (테이블이 없으면 1146 오류)
+            cursor.execute(f"SELECT 1 FROM {table_name} LIMIT 1")
+            has_rows = cursor.fetchone() is not None
             cursor.close()
-            connection.close()
 
-            logging.info(f"📊 {date_str} 데이터 확인: {count}개 종목")
-            return count > 0
+            logging.info(f"📊 {date_str} 데이터 확인: {'있음' if has_rows else '없음'}")
+            return has_rows
+
+        except pymysql.err.ProgrammingError as e:
+            if e.args and e.args[0] == ER_NO_SUCH_TABLE:
+                return False
+            logging.error(f"❌ 데이터 존재 확인 실패 ({date_str}): {e}")
+            return False
 
         except Exception as e:
             logging.error(f"❌ 데이터 존재 확인 실패 ({date_str}): {e}")
             return False
 
-    def get_theme_analysis_results(self, date_str: str) -> List[Dict]:
+        finally:
+            if connection:
+                connection.close()
+
+    def get_theme_analysis_results(self, date_str: str) -> List[ThemeResult]:
         """테마별 분석 결과 조회 (카드 표시용)"""
+        try:
+            themes = list(self.iter_theme_analysis_results(date_str))
+        except Exception:
+            return []
+
+        logging.info(f"📊 {date_str} 테마 분석 결과: {len(themes)}개 테마")
+        return themes
+
+    def get_top_theme_analysis_results(self, date_str: str, limit: int = 5) -> List[ThemeResult]:
+        """등락률 상위 테마 분석 결과 조회 (SQL LIMIT으로 필요한 행만 전송)"""
+        try:
+            return list(self.iter_theme_analysis_results(date_str, limit=limit))
+        except Exception:
+            return []
+
+    def iter_theme_analysis_results(self, date_str: str, limit: Optional[int] = None,
+                                    check_exists: bool = True) -> Iterator[ThemeResult]:
+        """
+        테마별 분석 결과를 DB 행이 도착하는 대로 하나씩 생성 (스트리밍 응답용, 조회 실패 시 예외)
+
+        Args:
+            date_str: 조회 날짜
+            limit: 최대 테마 수 (None이면 전체)
+            check_exists: 테이블 존재 확인 여부 (호출측에서 이미 확인했으면 False로 조회 1회 생략)
+        """
+        connection = None
         try:
             clean_date = date_str.replace('-', '')
             table_name = f"theme_{clean_date}"
 
-            if not self.has_data_for_date(date_str):
-                return []
+            if check_exists and not self.has_data_for_date(date_str):
+                return
 
             connection = self.get_connection(self.crawling_db)
-            cursor = connection.cursor()
+            # 서버 측 커서: 결과 전체를 메모리에 올리지 않고 행 단위로 수신
+            cursor = connection.cursor(pymysql.cursors.SSCursor)
 
             # 테마별 통계 계산
             query = f"""
-            SELECT 
-                JSON_UNQUOTE(JSON_EXTRACT(themes, '$[0]')) as theme_name,
-                COUNT(*) as stock_count,
-                AVG(change_rate) as avg_change_rate,
-                SUM(CASE WHEN change_rate > 0 THEN 1 ELSE 0 END) as positive_stocks,
-                SUM(volume) as total_volume,
-                AVG(JSON_LENGTH(news)) as avg_news_count
-            FROM {table_name}
-            GROUP BY theme_name
-            HAVING stock_count >= 3  -- 최소 3개 종목 이상
+            {self._theme_stats_sql(table_name)}
             ORDER BY avg_change_rate DESC
             """
 
-            cursor.execute(query)
-            results = cursor.fetchall()
-
-            cursor.close()
-            connection.close()
+            if limit is None:
+                cursor.execute(query)
+            else:
+                cursor.execute(query + " LIMIT %s", (int(limit),))
 
             # 결과 포맷팅 (카드 표시용)
-            themes = []
             for i, (
             theme_name, stock_count, avg_change_rate, positive_stocks, total_volume, avg_news_count) in enumerate(
-                    results):
+                    cursor):
                 # 테마 아이콘 매핑
                 icon = self._get_theme_icon(theme_name)
 
@@ -187,30 +502,95 @@ class TopRateDatabase:
                 # 테마 강도 계산
                 strength = self._calculate_theme_strength(avg_change_rate, positive_ratio, stock_count)
 
-                theme_data = {
-                    'rank': i + 1,
-                    'theme_name': theme_name,
-                    'icon': icon,
-                    'stock_count': int(stock_count),
-                    'avg_change_rate': round(float(avg_change_rate), 2),
-                    'positive_stocks': int(positive_stocks),
-                    'positive_ratio': round(positive_ratio, 1),
-                    'total_volume': int(total_volume) if total_volume else 0,
-                    'avg_news_count': round(float(avg_news_count), 1) if avg_news_count else 0,
-                    'strength': strength,
-                    'date': date_str
-                }
-                themes.append(theme_data)
+                yield ThemeResult(
+                    rank=i + 1,
+                    theme_name=theme_name,
+                    icon=icon,
+                    stock_count=int(stock_count),
+                    avg_change_rate=round(float(avg_change_rate), 2),
+                    positive_stocks=int(positive_stocks),
+                    positive_ratio=round(float(positive_ratio), 1),
+                    total_volume=int(total_volume) if total_volume else 0,
+                    avg_news_count=round(float(avg_news_count), 1) if avg_news_count else 0,
+                    strength=strength,
+                    date=date_str
+                )
 
-            logging.info(f"📊 {date_str} 테마 분석 결과: {len(themes)}개 테마")
-            return themes
+            cursor.close()
 
         except Exception as e:
+            # 스트리밍 중 실패를 정상 종료로 오인하지 않도록 호출측에 전달
             logging.error(f"❌ 테마 분석 결과 조회 실패 ({date_str}): {e}")
-            return []
+            raise
+
+        finally:
+            if connection:
+                connection.close()
+
+    def get_theme_summary(self, date_str: str) -> Optional[Dict]:
+        """테마 분석 요약 통계를 SQL에서 한 번에 집계 (테마 행을 가져오지 않음)"""
+        try:
+            clean_date = date_str.replace('-', '')
+            table_name = f"theme_{clean_date}"
+
+            if not self.has_data_for_date(date_str):
+                return None
+
+            connection = self.get_connection(self.crawling_db)
+            cursor = connection.cursor()
+
+            # _calculate_theme_strength와 동일한 기준으로 강도 분류
+            query = f"""
+            SELECT 
+                COUNT(*),
+                SUM(stock_count),
+                AVG(ROUND(avg_change_rate, 2)),
+                {_STRENGTH_SUM_SQL}
+            FROM (
+                SELECT 
+                    stock_count,
+                    avg_change_rate,
+                    {_STRENGTH_CASE_SQL} as strength
+                FROM ({self._theme_stats_sql(table_name)}) theme_stats
+            ) theme_strengths
+            """
+
+            cursor.execute(query)
+            total_themes, total_stocks, avg_change_rate, *strength_values = cursor.fetchone()
+
+            cursor.close()
+            connection.close()
+
+            if not total_themes:
+                return None
+
+            strength_counts = {
+                strength: int(count)
+                for strength, count in zip(_STRENGTH_ORDER, strength_values)
+                if count
+            }
+
+            return {
+                'total_themes': int(total_themes),
+                'total_stocks': int(total_stocks),
+                'avg_change_rate': round(float(avg_change_rate), 2),
+                'strength_distribution': strength_counts
+            }
+
+        except Exception as e:
+            logging.error(f"❌ 테마 요약 통계 조회 실패 ({date_str}): {e}")
+            return None
 
     def get_theme_detail(self, theme_name: str, date_str: str) -> Optional[Dict]:
         """특정 테마의 상세 정보 조회 (모달 표시용)"""
+        return self.get_theme_details([theme_name], date_str).get(theme_name)
+
+    def get_theme_details(self, theme_names: List[str], date_str: str) -> Dict[str, Dict]:
+        """여러 테마의 상세 정보를 한 번의 쿼리로 조회 (테마명 → 상세 정보, 없는 테마는 제외)"""
+        theme_names = list(dict.fromkeys(theme_names))
+        if not theme_names:
+            return {}
+
         try:
             clean_date = date_str.replace('-', '')
             table_name = f"theme_{clean_date}"
@@ -218,88 +598,110 @@ class TopRateDatabase:
             connection = self.get_connection(self.crawling_db)
             cursor = connection.cursor()
 
-            # 테마에 속한 종목들 조회
+            # 요청한 테마 중 하나라도 속한 종목들 조회
+            conditions = ' OR '.join(['JSON_CONTAINS(themes, JSON_QUOTE(%s))'] * len(theme_names))
             query = f"""
             SELECT 
-                stock_code, stock_name, price, change_rate, volume, news, theme_stocks
+                stock_code, stock_name, price, change_rate, volume, themes, news, theme_stocks
             FROM {table_name}
-            WHERE JSON_CONTAINS(themes, JSON_QUOTE(%s))
+            WHERE {conditions}
             ORDER BY change_rate DESC
             """
 
-            cursor.execute(query, (theme_name,))
-            stocks = cursor.fetchall()
-
-            if not stocks:
-                cursor.close()
-                connection.close()
-                return None
-
-            # 종목 리스트 구성
-            stock_list = []
-            all_news = []
-            total_volume = 0
-
-            for stock_code, stock_name, price, change_rate, volume, news_json, theme_stocks_json in stocks:
-                # 뉴스 파싱
-                try:
-                    stock_news = json.loads(news_json) if news_json else []
-                    all_news.extend(stock_news)
-                except:
-                    stock_news = []
-
-                # 테마 내 종목 정보 파싱
-                try:
-                    theme_stocks = json.loads(theme_stocks_json) if theme_stocks_json else {}
-                    theme_stock_count = len(theme_stocks.get(theme_name, []))
-                except:
-                    theme_stock_count = 0
-
-                stock_info = {
-                    'rank': len(stock_list) + 1,
-                    'stock_code': stock_code,
-                    'stock_name': stock_name,
-                    'current_price': int(price) if price else 0,
-                    'change_rate': float(change_rate) if change_rate else 0,
-                    'volume': int(volume) if volume else 0,
-                    'news_count': len(stock_news),
-                    'theme_stock_count': theme_stock_count
-                }
-                stock_list.append(stock_info)
-                total_volume += stock_info['volume']
+            cursor.execute(query, theme_names)
+            rows = cursor.fetchall()
 
             cursor.close()
             connection.close()
 
-            # 테마 요약 통계
-            positive_stocks = sum(1 for stock in stock_list if stock['change_rate'] > 0)
-            avg_change_rate = sum(stock['change_rate'] for stock in stock_list) / len(stock_list)
-
-            # 최신 뉴스 5개 선별 (시간순)
-            recent_news = sorted(all_news, key=lambda x: x.get('time', ''), reverse=True)[:5]
-
-            theme_detail = {
-                'theme_name': theme_name,
-                'icon': self._get_theme_icon(theme_name),
-                'date': date_str,
-                'summary': {
-                    'total_stocks': len(stock_list),
-                    'positive_stocks': positive_stocks,
-                    'positive_ratio': round(positive_stocks / len(stock_list) * 100, 1),
-                    'avg_change_rate': round(avg_change_rate, 2),
-                    'total_volume': total_volume,
-                    'total_news': len(all_news)
-                },
-                'stocks': stock_list,
-                'recent_news': recent_news
-            }
+            # 테마별로 종목 분배 (정렬 순서 유지)
+            # 뉴스/테마 구성 JSON은 여러 테마에 속한 종목이라도 행마다 한 번만 파싱
+            requested = set(theme_names)
+            rows_by_theme = defaultdict(list)
+            for stock_code, stock_name, price, change_rate, volume, themes_json, news_json, theme_stocks_json in rows:
+                matched = requested.intersection(_load_json_column(themes_json, ()))
+                if not matched:
+                    continue
+
+                parsed_row = (
+                    stock_code, stock_name, price, change_rate, volume,
+                    _load_json_column(news_json, ()),
+                    _load_json_column(theme_stocks_json, {})
+                )
+                for theme_name in matched:
+                    rows_by_theme[theme_name].append(parsed_row)
 
-            logging.info(f"📋 {theme_name} 상세 정보: {len(stock_list)}개 종목, {len(all_news)}개 뉴스")
-            return theme_detail
+            return {
+                theme_name: self._build_theme_detail(theme_name, date_str, rows_by_theme[theme_name])
+                for theme_name in theme_names
+                if theme_name in rows_by_theme
+            }
 
         except Exception as e:
-            logging.error(f"❌ 테마 상세 정보 조회 실패 ({theme_name}): {e}")
-            return None
+            logging.error(f"❌ 테마 상세 정보 조회 실패 ({', '.join(theme_names)}): {e}")
+            return {}
+
+    def _build_theme_detail(self, theme_name: str, date_str: str, stocks: List[tuple]) -> Dict:
+        """테마 소속 종목 행(뉴스/테마 구성 JSON 파싱 완료)으로 상세 정보 구성"""
+        # 종목 리스트 구성
+        # 요약 통계도 같은 루프에서 누적 (종목 리스트 재순회 없음)
+        stock_list = []
+        news_lists = []  # 종목별 뉴스 리스트 참조만 모음 (전체 뉴스를 한 리스트로 복사하지 않음)
+        total_news = 0
+        total_volume = 0
+        total_change_rate = 0.0
+        positive_stocks = 0
+
+        for stock_code, stock_name, price, change_rate, volume, stock_news, theme_stocks in stocks:
+            news_lists.append(stock_news)
+            total_news += len(stock_news)
+
+            # 테마 내 종목 수
+            try:
+                theme_stock_count = len(theme_stocks.get(theme_name, []))
+            except:
+                theme_stock_count = 0
+
+            stock_info = ThemeStock(
+                rank=len(stock_list) + 1,
+                stock_code=stock_code,
+                stock_name=stock_name,
+                current_price=int(price) if price else 0,
+                change_rate=float(change_rate) if change_rate else 0,
+                volume=int(volume) if volume else 0,
+                news_count=len(stock_news),
+                theme_stock_count=theme_stock_count
+            )
+            stock_list.append(stock_info)
+            total_volume += stock_info.volume
+            total_change_rate += stock_info.change_rate
+            if stock_info.change_rate > 0:
+                positive_stocks += 1
+
+        # 테마 요약 통계
+        avg_change_rate = total_change_rate / len(stock_list)
+
+        # 최신 뉴스 5개 선별 (시간순, 전체 정렬 없이 상위 5개만)
+        recent_news = heapq.nlargest(5, chain.from_iterable(news_lists), key=lambda x: x.get('time', ''))
+
+        theme_detail = {
+            'theme_name': theme_name,
+            'icon': self._get_theme_icon(theme_name),
+            'date': date_str,
+            'summary': {
+                'total_stocks': len(stock_list),
+                'positive_stocks': positive_stocks,
+                'positive_ratio': round(positive_stocks / len(stock_list) * 100, 1),
+                'avg_change_rate': round(avg_change_rate, 2),
+                'total_volume': total_volume,
+                'total_news': total_news
+            },
+            'stocks': stock_list,
+            'recent_news': recent_news
+        }
+
+        logging.info(f"📋 {theme_name} 상세 정보: {len(stock_list)}개 종목, {total_news}개 뉴스")
+        return theme_detail
 
     def get_system_status(self) -> Dict:
         """시스템 상태 정보 조회 (실시간 모니터링용)"""
@@ -313,7 +715,7 @@ class TopRateDatabase:
 
             # 최신 테이블 정보
             if all_tables:
-                latest_table = sorted([table[0] for table in all_tables])[-1]
+                latest_table = max(table for (table,) in all_tables)
 
                 # 최신 데이터 통계
                 cursor.execute(f"SELECT COUNT(*) FROM {latest_table}")
@@ -322,7 +724,7 @@ class TopRateDatabase:
                 cursor.execute(f"""
                 SELECT 
                     COUNT(DISTINCT JSON_UNQUOTE(JSON_EXTRACT(themes, '$[0]'))) as theme_count,
-                    SUM(JSON_LENGTH(news)) as total_news,
+                    SUM(COALESCE(JSON_LENGTH(news), 0)) as total_news,
                     MAX(created_at) as last_update
                 FROM {latest_table}
                 """)
@@ -362,7 +764,7 @@ class TopRateDatabase:
                     'newest_date': self._extract_date_from_table(all_tables[-1][0]) if all_tables else None
                 },
                 'health_check': {
-                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'timestamp': now_str(),
                     'status': 'operational'
                 }
             }
@@ -374,7 +776,7 @@ class TopRateDatabase:
             return {
                 'database': {'status': 'error', 'error': str(e)},
                 'health_check': {
-                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'timestamp': now_str(),
                     'status': 'error'
                 }
             }
@@ -419,35 +821,30 @@ class TopRateDatabase:
 
     def _get_theme_icon(self, theme_name: str) -> str:
         """테마별 아이콘 매핑"""
-        icon_mapping = {
-            '증권': '🏦', 'AI반도체': '🤖', '2차전지': '🔋',
-            'AI': '🤖', '반도체': '💾', '바이오': '🧬',
-            '게임': '🎮', '자동차': '🚗', '화학': '⚗️',
-            '조선': '🚢', '항공': '✈️', '건설': '🏗️',
-            '통신': '📡', '은행': '🏛️', '헬스케어': '🏥',
-            '엔터테인먼트': '🎭', '코로나19': '🦠',
-            'K-pop': '🎵', '메타버스': '🌐', '전기차': '⚡',
-            '친환경': '🌱', '우주항공': '🚀', '로봇': '🤖',
-            'VR': '🥽', 'AR': '🥽', '블록체인': '⛓️'
-        }
-
-        # 테마명에서 키워드 찾기
-        for keyword, icon in icon_mapping.items():
-            if keyword in theme_name:
-                return icon
+        return get_theme_icon(theme_name)
 
-        return '📈'  # 기본 아이콘
+    def _theme_stats_sql(self, table_name: str) -> str:
+        """테마별 통계 SELECT 문 (대표 테마 기준, 3개 종목 이상)"""
+        return f"""
+            SELECT 
+                JSON_UNQUOTE(JSON_EXTRACT(themes, '$[0]')) as theme_name,
+                COUNT(*) as stock_count,
+                AVG(change_rate) as avg_change_rate,
+                SUM(CASE WHEN change_rate > 0 THEN 1 ELSE 0 END) as positive_stocks,
+                SUM(volume) as total_volume,
+                AVG(COALESCE(JSON_LENGTH(news), 0)) as avg_news_count
+            FROM {table_name}
+            GROUP BY theme_name
+            HAVING stock_count >= 3  -- 최소 3개 종목 이상
+        """
 
     def _calculate_theme_strength(self, avg_change_rate: float, positive_ratio: float, stock_count: int) -> str:
-        """테마 강도 계산"""
-        if avg_change_rate >= 5.0 and positive_ratio >= 80:
-            return 'HOT'
-        elif avg_change_rate >= 3.0 and positive_ratio >= 70:
-            return 'STRONG'
-        elif avg_change_rate >= 1.0 and positive_ratio >= 60:
-            return 'NORMAL'
-        else:
-            return 'WEAK'
+        """테마 강도 계산 (두 기준 중 낮은 단계로 결정)"""
+        level = min(
+            bisect_right(_STRENGTH_CHANGE_THRESHOLDS, avg_change_rate),
+            bisect_right(_STRENGTH_RATIO_THRESHOLDS, positive_ratio)
+        )
+        return _STRENGTH_GRADES[level]
 
     def _extract_date_from_table(self, table_name: str) -> Optional[str]:
         """테이블명에서 날짜 추출"""
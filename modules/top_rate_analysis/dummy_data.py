@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+등락율상위분석 더미 데이터 (DUMMY_DATA 설정 시 사용)
+- DB/크롤링 없이 화면 테스트용 응답 제공
+- 실제 API와 동일한 응답 구조
+- 모듈 로드 시 한 번만 생성
+"""
+
+import time
+from typing import Callable, Dict, List, Optional
+
+from .database import ThemeResult
+from .utils import get_trading_date
+
+DUMMY_THEMES = (
+    {
+        'rank': 1,
+        'theme_name': 'AI반도체',
+        'icon': '🤖',
+        'stock_count': 15,
+        'avg_change_rate': 4.25,
+        'positive_stocks': 12,
+        'positive_ratio': 80.0,
+        'total_volume': 150300000,
+        'avg_news_count': 4.2,
+        'strength': 'STRONG'
+    },
+    {
+        'rank': 2,
+        'theme_name': '2차전지',
+        'icon': '🔋',
+        'stock_count': 8,
+        'avg_change_rate': 3.18,
+        'positive_stocks': 6,
+        'positive_ratio': 75.0,
+        'total_volume': 125700000,
+        'avg_news_count': 3.8,
+        'strength': 'STRONG'
+    },
+    {
+        'rank': 3,
+        'theme_name': '바이오',
+        'icon': '🧬',
+        'stock_count': 12,
+        'avg_change_rate': 2.85,
+        'positive_stocks': 8,
+        'positive_ratio': 66.7,
+        'total_volume': 98200000,
+        'avg_news_count': 3.1,
+        'strength': 'NORMAL'
+    },
+    {
+        'rank': 4,
+        'theme_name': '게임',
+        'icon': '🎮',
+        'stock_count': 6,
+        'avg_change_rate': 1.92,
+        'positive_stocks': 4,
+        'positive_ratio': 66.7,
+        'total_volume': 87400000,
+        'avg_news_count': 2.5,
+        'strength': 'NORMAL'
+    },
+    {
+        'rank': 5,
+        'theme_name': '자동차',
+        'icon': '🚗',
+        'stock_count': 10,
+        'avg_change_rate': 0.75,
+        'positive_stocks': 6,
+        'positive_ratio': 60.0,
+        'total_volume': 110800000,
+        'avg_news_count': 2.0,
+        'strength': 'WEAK'
+    },
+    {
+        'rank': 6,
+        'theme_name': '조선',
+        'icon': '🚢',
+        'stock_count': 5,
+        'avg_change_rate': -0.45,
+        'positive_stocks': 2,
+        'positive_ratio': 40.0,
+        'total_volume': 92100000,
+        'avg_news_count': 1.4,
+        'strength': 'WEAK'
+    },
+    {
+        'rank': 7,
+        'theme_name': '화학',
+        'icon': '⚗️',
+        'stock_count': 7,
+        'avg_change_rate': -1.20,
+        'positive_stocks': 2,
+        'positive_ratio': 28.6,
+        'total_volume': 78900000,
+        'avg_news_count': 1.0,
+        'strength': 'WEAK'
+    }
+)
+
+DUMMY_PAST_DATES = ('2025-08-13', '2025-08-12', '2025-08-09')
+
+_DUMMY_DETAIL_STOCKS = (
+    {
+        'rank': 1,
+        'stock_code': '000660',
+        'stock_name': 'SK하이닉스',
+        'current_price': 120000,
+        'change_rate': 4.2,
+        'volume': 8000000,
+        'news_count': 1,
+        'theme_stock_count': 2
+    },
+    {
+        'rank': 2,
+        'stock_code': '005930',
+        'stock_name': '삼성전자',
+        'current_price': 75000,
+        'change_rate': 2.5,
+        'volume': 10000000,
+        'news_count': 0,
+        'theme_stock_count': 2
+    }
+)
+
+_DUMMY_DETAIL_SUMMARY = {
+    'total_stocks': len(_DUMMY_DETAIL_STOCKS),
+    'positive_stocks': 2,
+    'positive_ratio': 100.0,
+    'avg_change_rate': 3.35,
+    'total_volume': 18000000,
+    'total_news': 1
+}
+
+_THEME_ICONS = {theme['theme_name']: theme['icon'] for theme in DUMMY_THEMES}
+
+
+def dummy_theme_results(date_str: str) -> List[ThemeResult]:
+    """테마별 분석 결과 (get_theme_analysis_results와 동일 구조)"""
+    return [ThemeResult(**theme, date=date_str) for theme in DUMMY_THEMES]
+
+
+def dummy_theme_detail(theme_name: str, date_str: str) -> Dict:
+    """테마 상세 정보 (get_theme_detail과 동일 구조, 테마명/날짜만 요청별로 채움)"""
+    return {
+        'theme_name': theme_name,
+        'icon': _THEME_ICONS.get(theme_name, '📈'),
+        'date': date_str,
+        'summary': _DUMMY_DETAIL_SUMMARY,
+        'stocks': _DUMMY_DETAIL_STOCKS,
+        'recent_news': [
+            {
+                'title': f'{theme_name} 관련 주요 뉴스',
+                'summary': '테마 관련 최신 동향',
+                'time': date_str
+            }
+        ]
+    }
+
+
+def dummy_available_dates() -> List[str]:
+    """사용 가능한 날짜 목록 (현재 거래일 + 고정 과거 날짜)"""
+    return [get_trading_date(), *DUMMY_PAST_DATES]
+
+
+class DummyCrawler:
+    """크롤링 시뮬레이션 (TopRateCrawler와 동일한 인터페이스)"""
+
+    def __init__(self, progress_callback: Optional[Callable] = None):
+        self.progress_callback = progress_callback
+
+    def crawl_and_save(self, target_date: Optional[str] = None) -> bool:
+        """10단계 진행상황만 보고하고 성공 처리"""
+        for i in range(1, 11):
+            time.sleep(0.3)
+            if self.progress_callback:
+                self.progress_callback(i * 10, f'테마 {i}/10 수집 중... (더미 데이터)')
+        return True
@@ -9,15 +9,27 @@
 - 테마 카드 및 상세 모달
 """
 
-import json
+import gzip
+import itertools
 import logging
+import re
 import threading
-from datetime import datetime
-from flask import Blueprint, render_template, request, jsonify, current_app
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from typing import Callable, Dict, Optional
+
+import orjson
+from cachetools import TTLCache
+from cachetools.func import ttl_cache
+from flask import Blueprint, render_template, request, current_app, stream_with_context
+
+from common.json_provider import ORJSON_OPTIONS, orjson_default
 
 from .database import TopRateDatabase
 from .crawler import TopRateCrawler
-from .utils import get_trading_date, get_table_name, format_date_for_display
+from .dummy_data import DummyCrawler, dummy_theme_results, dummy_theme_detail, dummy_available_dates
+from .utils import get_trading_date, format_timestamp, now_str
 
 # Blueprint 생성
 top_rate_bp = Blueprint(
@@ -28,23 +40,266 @@ top_rate_bp = Blueprint(
     static_url_path='/top_rate_static'
 )
 
+# 개발자 도구 Blueprint (DEBUG 모드에서만 등록)
+top_rate_dev_bp = Blueprint('top_rate_dev', __name__)
+
 # 전역 변수
+# 요청 쓰레드 간 공유 상태는 모두 불변 객체를 통째로 교체하거나(진행상황, 각종 캐시 튜플)
+# 락이 있는 캐시(cachetools.func, lru_cache)만 사용 → GIL 없는 free-threaded 빌드에서도 안전
+# db는 호출마다 새 연결을 만드는 무상태 객체, 크롤러 인스턴스는 크롤링 쓰레드 지역 변수
 db = TopRateDatabase()
-crawler = None
-
-# 실제 진행상황 추적
-crawling_progress = {
-    'is_running': False,
-    'percent': 0,
-    'message': '대기 중',
-    'start_time': None,
-    'end_time': None,
-    'success': None,
-    'error_message': '',
-    'current_theme': '',
-    'total_themes': 0,
-    'processed_themes': 0
-}
+
+# 백그라운드 크롤링 실행기 (요청마다 쓰레드를 만들지 않고 단일 워커 재사용)
+crawl_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='top-rate-crawl')
+
+# 날짜별 대기/실행 중인 크롤링 작업 (진행상황이 리셋돼도 실제 실행 여부 판단, 같은 날짜 중복 실행 방지)
+_crawl_futures: Dict[str, Future] = {}
+_crawl_futures_lock = threading.Lock()
+
+
+def _crawl_in_flight(target_date: Optional[str] = None) -> Optional[Future]:
+    """대기/실행 중인 크롤링 작업 반환 (날짜 지정 시 해당 날짜만, 없으면 None)"""
+    with _crawl_futures_lock:
+        futures = [_crawl_futures.get(target_date)] if target_date else list(_crawl_futures.values())
+    return next((future for future in futures if future is not None and not future.done()), None)
+
+
+def _submit_crawl(target_date: str, fn: Callable) -> Future:
+    """크롤링 작업 제출 후 날짜별로 등록 (완료 시 자동 해제)"""
+    future = crawl_executor.submit(fn)
+
+    def _release(done_future):
+        with _crawl_futures_lock:
+            if _crawl_futures.get(target_date) is done_future:
+                del _crawl_futures[target_date]
+
+        # 작업 안에서 처리하지 못한 예외가 Future에 묻히지 않도록 기록
+        if not done_future.cancelled() and done_future.exception() is not None:
+            logging.error(f"❌ 크롤링 작업 예외 ({target_date}): {done_future.exception()}")
+
+    with _crawl_futures_lock:
+        _crawl_futures[target_date] = future
+    future.add_done_callback(_release)
+    return future
+
+
+# ============= 진행상황 추적 =============
+
+@dataclass(frozen=True, slots=True)
+class CrawlProgress:
+    """크롤링 진행상황 스냅샷 (불변 객체, 갱신 시 통째로 교체)"""
+    is_running: bool = False
+    percent: int = 0
+    message: str = '대기 중'
+    start_time: Optional[float] = None  # epoch 초, 응답 시에만 문자열로 변환
+    end_time: Optional[float] = None
+    success: Optional[bool] = None
+    error_message: str = ''
+    current_theme: str = ''
+    total_themes: int = 0
+    processed_themes: int = 0
+
+
+# 읽기는 참조 한 번으로 끝나고, 쓰기만 락으로 직렬화
+crawling_progress = CrawlProgress()
+_progress_lock = threading.Lock()
+_progress_changed = threading.Condition(_progress_lock)
+
+# SSE 진행상황 스트림 설정 (초)
+PROGRESS_STREAM_HEARTBEAT = 15
+PROGRESS_STREAM_MAX_SECONDS = 600
+PROGRESS_STREAM_RETRY_MS = 2000
+
+
+def _update_progress(**changes) -> CrawlProgress:
+    """진행상황 필드 갱신 후 새 스냅샷 게시"""
+    global crawling_progress
+    with _progress_lock:
+        crawling_progress = replace(crawling_progress, **changes)
+        _progress_changed.notify_all()
+        return crawling_progress
+
+
+def _start_progress(**changes) -> bool:
+    """실행 중이 아니면 진행상황을 초기화하고 실행 상태로 전환 (확인과 전환을 원자적으로)"""
+    global crawling_progress
+    with _progress_lock:
+        if crawling_progress.is_running:
+            return False
+        crawling_progress = CrawlProgress(is_running=True, **changes)
+        _progress_changed.notify_all()
+        return True
+
+
+# 스냅샷이 바뀔 때만 다시 직렬화 (폴링 요청마다 인코딩하지 않음)
+_progress_json_cache = (None, b'')
+
+
+def _progress_dict(progress: CrawlProgress) -> Dict:
+    """진행상황 스냅샷의 응답용 dict (시작/종료 시각은 문자열로 변환)"""
+    progress_data = asdict(progress)
+    progress_data['start_time'] = format_timestamp(progress.start_time)
+    progress_data['end_time'] = format_timestamp(progress.end_time)
+    return progress_data
+
+
+def _progress_json(progress: CrawlProgress) -> bytes:
+    """진행상황 스냅샷의 JSON 바이트 (같은 스냅샷이면 캐시 재사용)"""
+    global _progress_json_cache
+    cached_progress, cached_body = _progress_json_cache
+    if cached_progress is not progress:
+        cached_body = orjson.dumps(_progress_dict(progress))
+        _progress_json_cache = (progress, cached_body)
+    return cached_body
+
+
+# ============= 조회 캐시 =============
+
+@ttl_cache(maxsize=1, ttl=60)
+def _cached_available_dates():
+    """사용 가능한 날짜 목록 (크롤링 성공 시에만 바뀌므로 60초 캐시)"""
+    return db.get_available_dates()
+
+
+# 시스템 상태 캐시 (정상 조회 결과만 저장, DB 오류 상태는 저장하지 않아 복구 즉시 반영)
+_system_status_cache = TTLCache(maxsize=1, ttl=60)
+_system_status_cache_lock = threading.Lock()
+
+
+def _cached_system_status():
+    """시스템 상태 (정상 결과만 60초 캐시, 호출측에서 수정 시 복사해서 사용)"""
+    with _system_status_cache_lock:
+        status = _system_status_cache.get('status')
+    if status is not None:
+        return status
+
+    status = db.get_system_status()
+    if status.get('database', {}).get('status') != 'error':
+        with _system_status_cache_lock:
+            _system_status_cache['status'] = status
+    return status
+
+
+# 데이터가 있다고 확인된 날짜 (있음 응답만 캐시, 60초마다 비움)
+PRESENT_DATES_TTL = 60
+_present_dates = (0.0, frozenset())
+
+
+def _has_data(date_str: str) -> bool:
+    """날짜 데이터 존재 여부 (확인된 날짜는 DB 조회 생략)"""
+    global _present_dates
+    checked_at, dates = _present_dates
+    now = time.monotonic()
+    if now - checked_at > PRESENT_DATES_TTL:
+        checked_at, dates = now, frozenset()
+        _present_dates = (checked_at, dates)
+
+    if date_str in dates:
+        return True
+
+    if not db.has_data_for_date(date_str):
+        return False
+
+    # 집합을 통째로 교체 (읽는 쪽은 잠금 없이 참조)
+    _present_dates = (checked_at, dates | {date_str})
+    return True
+
+
+# 날짜별 결과 캐시: 당일은 크롤링으로 바뀔 수 있어 60초 TTL
+# 지난 거래일도 강제 크롤링/스케줄러/다른 워커 프로세스에서 다시 수집될 수 있고
+# _invalidate_date_caches는 요청을 처리한 프로세스에서만 실행되므로 긴 TTL로 최대 지연 시간 제한
+PAST_DATE_CACHE_TTL = 600
+_theme_cache_lock = threading.Lock()
+_past_theme_details = TTLCache(maxsize=256, ttl=PAST_DATE_CACHE_TTL)
+_today_theme_details = TTLCache(maxsize=64, ttl=60)
+_past_analysis_bodies = TTLCache(maxsize=32, ttl=PAST_DATE_CACHE_TTL)
+_today_analysis_bodies = TTLCache(maxsize=4, ttl=60)
+_past_daily_summaries = TTLCache(maxsize=32, ttl=PAST_DATE_CACHE_TTL)
+_today_daily_summaries = TTLCache(maxsize=4, ttl=60)
+
+
+def _date_cache(date_str: str, past_cache, today_cache):
+    """날짜에 맞는 캐시 선택 (지난 거래일 / 당일)"""
+    return past_cache if date_str < get_trading_date() else today_cache
+
+
+def _cached_theme_details(theme_names: list, date_str: str) -> dict:
+    """여러 테마 상세 정보 조회 (캐시에 없는 테마만 DB에서 한 번에 조회)"""
+    cache = _date_cache(date_str, _past_theme_details, _today_theme_details)
+
+    with _theme_cache_lock:
+        details = {name: cache[(name, date_str)] for name in theme_names if (name, date_str) in cache}
+
+    missing = [name for name in theme_names if name not in details]
+    if missing:
+        fetched = db.get_theme_details(missing, date_str)
+        with _theme_cache_lock:
+            for name, detail in fetched.items():
+                cache[(name, date_str)] = detail
+        details.update(fetched)
+
+    return details
+
+
+def _invalidate_date_caches():
+    """날짜/테이블 구성이 바뀐 뒤 캐시 무효화"""
+    global _present_dates
+    _cached_available_dates.cache_clear()
+    with _system_status_cache_lock:
+        _system_status_cache.clear()
+    _present_dates = (0.0, frozenset())
+    with _theme_cache_lock:
+        _past_theme_details.clear()
+        _today_theme_details.clear()
+        _past_analysis_bodies.clear()
+        _today_analysis_bodies.clear()
+        _past_daily_summaries.clear()
+        _today_daily_summaries.clear()
+
+
+# ============= 응답 헬퍼 =============
+
+def _resp(obj, status: int = 200):
+    """JSON 응답 (앱 JSON 프로바이더(orjson)로 직렬화, Decimal 등 변환 규칙 공유)"""
+    response = current_app.json.response(obj)
+    response.status_code = status
+    return response
+
+
+def _message_resp(success: bool, message: str, status: int = 200):
+    """success/message 두 필드만 있는 짧은 응답 (대부분의 에러 응답)"""
+    return _raw_json(orjson.dumps({'success': success, 'message': message}), status)
+
+
+# 이 크기 이상인 캐시 본문만 gzip 사본을 함께 저장 (작은 본문은 압축 이득보다 비용이 큼)
+GZIP_MIN_SIZE = 2048
+
+
+def _cacheable_body(body: bytes) -> tuple:
+    """캐시용 (원본, gzip 사본 또는 None) 튜플 (압축은 저장 시 한 번만)"""
+    return body, gzip.compress(body, compresslevel=6) if len(body) >= GZIP_MIN_SIZE else None
+
+
+def _cached_json(cached: tuple):
+    """캐시 본문 응답 (클라이언트가 gzip을 받으면 미리 압축한 사본 전송)"""
+    body, gzipped = cached
+    if gzipped is not None and request.accept_encodings['gzip']:
+        response = _raw_json(gzipped)
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = _raw_json(body)
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def _raw_json(body: bytes, status: int = 200):
+    """직렬화된 JSON 바이트를 그대로 응답 (본문 재인코딩 검사 생략)"""
+    return current_app.response_class(body, status=status, mimetype='application/json', direct_passthrough=True)
+
+
+def _dummy_mode() -> bool:
+    """DUMMY_DATA 설정 시 DB/크롤링 대신 더미 데이터로 응답"""
+    return current_app.config.get('DUMMY_DATA', False)
 
 
 # ============= 페이지 라우트 =============
@@ -57,10 +312,10 @@ def index():
         trading_date = get_trading_date()
 
         # 실제 사용 가능한 날짜 목록
-        available_dates = db.get_available_dates()
+        available_dates = _cached_available_dates()
 
         # 시스템 상태 정보
-        system_status = db.get_system_status()
+        system_status = _cached_system_status()
 
         context = {
             'current_date': trading_date,
@@ -84,75 +339,84 @@ def index():
 @top_rate_bp.route('/api/collect-data', methods=['POST'])
 def collect_data():
     """실제 데이터 수집 (paste.txt 크롤링 실행)"""
-    global crawling_progress, crawler
-
     try:
-        data = request.get_json() or {}
-        target_date = data.get('date', get_trading_date())
-
-        # 이미 실행 중인지 확인
-        if crawling_progress['is_running']:
-            return jsonify({
-                'success': False,
-                'message': '이미 크롤링이 실행 중입니다.'
-            }), 400
-
-        # 크롤링 진행상황 초기화
-        crawling_progress.update({
-            'is_running': True,
-            'percent': 0,
-            'message': '크롤링 준비 중...',
-            'start_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'end_time': None,
-            'success': None,
-            'error_message': '',
-            'current_theme': '',
-            'total_themes': 0,
-            'processed_themes': 0
-        })
+        app = current_app._get_current_object()
+        data = request.get_json(silent=True) or {}
+        target_date = data.get('date') or get_trading_date()
+
+        # 같은 날짜 크롤링이 이미 진행 중이면 새로 시작하지 않고 현재 진행상황 반환
+        if _crawl_in_flight(target_date):
+            return _raw_json(orjson.dumps({
+                'success': True,
+                'already_running': True,
+                'progress': _progress_dict(crawling_progress),
+                'message': f'{target_date} 데이터 수집이 이미 진행 중입니다.',
+                'target_date': target_date
+            }))
+
+        # 이미 실행 중이 아니면 진행상황 초기화
+        started = not _crawl_in_flight() and _start_progress(
+            message='크롤링 준비 중...',
+            start_time=time.time()
+        )
+        if not started:
+            return _message_resp(False, '이미 크롤링이 실행 중입니다.', 409)
 
         # 진행상황 콜백 함수
         def progress_callback(percent, message):
-            crawling_progress['percent'] = percent
-            crawling_progress['message'] = message
-            current_app.logger.info(f"크롤링 진행: {percent}% - {message}")
+            _update_progress(percent=percent, message=message)
+            app.logger.info(f"크롤링 진행: {percent}% - {message}")
+
+        dummy_mode = _dummy_mode()
+        crawler_class = DummyCrawler if dummy_mode else TopRateCrawler
 
         # 백그라운드에서 실제 크롤링 실행
         def run_crawling():
-            global crawler
             try:
-                crawler = TopRateCrawler(progress_callback=progress_callback)
-                success = crawler.crawl_and_save(target_date)
-
-                crawling_progress.update({
-                    'is_running': False,
-                    'success': success,
-                    'end_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'percent': 100 if success else 0,
-                    'message': '크롤링 완료' if success else '크롤링 실패'
-                })
+                crawler = crawler_class(progress_callback=progress_callback)
+                if dummy_mode:
+                    success = crawler.crawl_and_save(target_date)
+                else:
+                    # 다른 워커 프로세스(또는 스케줄러)의 크롤링과 겹치지 않도록 DB 잠금 안에서 실행
+                    with db.crawl_lock() as acquired:
+                        if not acquired:
+                            raise RuntimeError('다른 프로세스에서 크롤링이 실행 중입니다.')
+                        success = crawler.crawl_and_save(target_date)
+
+                _update_progress(
+                    is_running=False,
+                    success=success,
+                    end_time=time.time(),
+                    percent=100 if success else 0,
+                    message='크롤링 완료' if success else '크롤링 실패'
+                )
 
                 if success:
-                    current_app.logger.info(f"✅ 실제 크롤링 완료: {target_date}")
+                    _invalidate_date_caches()
+                    app.logger.info(f"✅ 실제 크롤링 완료: {target_date}")
                 else:
-                    current_app.logger.error(f"❌ 실제 크롤링 실패: {target_date}")
+                    app.logger.error(f"❌ 실제 크롤링 실패: {target_date}")
+                return success
 
             except Exception as e:
-                crawling_progress.update({
-                    'is_running': False,
-                    'success': False,
-                    'error_message': str(e),
-                    'end_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'message': f'크롤링 오류: {str(e)}'
-                })
-                current_app.logger.error(f"❌ 크롤링 예외 발생: {e}")
-
-        # 별도 쓰레드에서 크롤링 실행
-        thread = threading.Thread(target=run_crawling)
-        thread.daemon = True
-        thread.start()
-
-        return jsonify({
+                _update_progress(
+                    is_running=False,
+                    success=False,
+                    error_message=str(e),
+                    end_time=time.time(),
+                    message=f'크롤링 오류: {str(e)}'
+                )
+                app.logger.error(f"❌ 크롤링 예외 발생: {e}")
+                return False
+
+        # 백그라운드 실행기에서 크롤링 실행
+        try:
+            _submit_crawl(target_date, run_crawling)
+        except Exception:
+            _update_progress(is_running=False, success=False, message='크롤링 시작 실패')
+            raise
+
+        return _resp({
             'success': True,
             'message': f'{target_date} 실제 데이터 수집을 시작했습니다.',
             'target_date': target_date
@@ -160,19 +424,54 @@ def collect_data():
 
     except Exception as e:
         current_app.logger.error(f"데이터 수집 시작 실패: {e}")
-        return jsonify({
-            'success': False,
-            'message': f'데이터 수집 시작 실패: {str(e)}'
-        }), 500
+        return _message_resp(False, f'데이터 수집 시작 실패: {str(e)}', 500)
 
 
 @top_rate_bp.route('/api/crawling-progress')
 def get_crawling_progress():
     """실제 크롤링 진행상황 조회"""
-    return jsonify({
-        'success': True,
-        'progress': crawling_progress
-    })
+    return _raw_json(b'{"success":true,"progress":' + _progress_json(crawling_progress) + b'}')
+
+
+def _progress_events():
+    """진행상황이 바뀔 때마다 SSE 이벤트 생성 (크롤링이 끝나면 마지막 상태를 보내고 종료)"""
+    deadline = time.monotonic() + PROGRESS_STREAM_MAX_SECONDS
+    last_sent = None
+
+    # 최대 유지 시간으로 끊긴 경우 브라우저 EventSource가 재연결할 간격
+    yield b'retry: %d\n\n' % PROGRESS_STREAM_RETRY_MS
+
+    while True:
+        progress = crawling_progress
+        if progress is not last_sent:
+            yield b'data: ' + _progress_json(progress) + b'\n\n'
+            last_sent = progress
+            if not progress.is_running:
+                return
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+
+        with _progress_changed:
+            _progress_changed.wait_for(
+                lambda: crawling_progress is not last_sent,
+                timeout=min(PROGRESS_STREAM_HEARTBEAT, remaining)
+            )
+
+        # 변경 없이 대기만 끝난 경우 연결 유지용 주석 전송 (끊긴 클라이언트 감지)
+        if crawling_progress is last_sent:
+            yield b': keep-alive\n\n'
+
+
+@top_rate_bp.route('/api/progress-stream')
+def stream_crawling_progress():
+    """크롤링 진행상황 SSE 스트림 (폴링 대체)"""
+    return current_app.response_class(
+        _progress_events(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
 
 # ============= 📊 실제 분석 API =============
@@ -181,56 +480,100 @@ def get_crawling_progress():
 def analyze_data():
     """실제 데이터 분석 (DB에서 실제 조회)"""
     try:
-        data = request.get_json() or {}
-        date_str = data.get('date', get_trading_date())
+        data = request.get_json(silent=True) or {}
+        date_str = data.get('date') or get_trading_date()
 
-        # 데이터 존재 확인
-        if not db.has_data_for_date(date_str):
-            return jsonify({
-                'success': False,
-                'message': f'{date_str} 데이터가 없습니다. 먼저 데이터를 수집하세요.'
-            }), 400
+        if _dummy_mode():
+            theme_iter = iter(dummy_theme_results(date_str))
+        else:
+            # 이미 한 번 끝까지 분석한 날짜는 직렬화된 응답을 그대로 반환
+            analysis_cache = _date_cache(date_str, _past_analysis_bodies, _today_analysis_bodies)
+            with _theme_cache_lock:
+                cached_body = analysis_cache.get(date_str)
+            if cached_body is not None:
+                return _cached_json(cached_body)
 
-        # 실제 테마별 분석 결과 조회
-        theme_results = db.get_theme_analysis_results(date_str)
+            # 데이터 존재 확인
+            if not _has_data(date_str):
+                return _message_resp(False, f'{date_str} 데이터가 없습니다. 먼저 데이터를 수집하세요.', 400)
 
-        if not theme_results:
-            return jsonify({
-                'success': False,
-                'message': f'{date_str} 분석할 데이터가 없습니다.'
-            }), 400
+            # 실제 테마별 분석 결과 조회 (DB 행이 도착하는 대로 스트리밍)
+            theme_iter = db.iter_theme_analysis_results(date_str, check_exists=False)
 
-        # 분석 요약 통계
-        total_themes = len(theme_results)
-        avg_change_rate = sum(theme['avg_change_rate'] for theme in theme_results) / total_themes
-        total_stocks = sum(theme['stock_count'] for theme in theme_results)
-        hot_themes = len([theme for theme in theme_results if theme['strength'] == 'HOT'])
+        first_theme = next(theme_iter, None)
 
-        analysis_summary = {
-            'date': date_str,
-            'total_themes': total_themes,
-            'total_stocks': total_stocks,
-            'avg_change_rate': round(avg_change_rate, 2),
-            'hot_themes': hot_themes,
-            'analysis_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
+        if first_theme is None:
+            return _message_resp(False, f'{date_str} 분석할 데이터가 없습니다.', 400)
 
-        current_app.logger.info(f"📊 {date_str} 실제 분석 완료: {total_themes}개 테마, {total_stocks}개 종목")
+        app = current_app._get_current_object()
+        cache_result = not _dummy_mode()
 
-        return jsonify({
-            'success': True,
-            'date': date_str,
-            'summary': analysis_summary,
-            'themes': theme_results,
-            'message': f'{date_str} 분석이 완료되었습니다.'
-        })
+        def generate():
+            # 끝까지 전송된 경우에만 전체 본문을 캐시에 저장
+            chunks = []
+
+            # 응답 머리 부분: success/message는 스트림 도중 조회가 실패할 수 있으므로 마지막 청크에서 결정
+            chunk = b'{"date":' + orjson.dumps(date_str) + b',"themes":['
+            chunks.append(chunk)
+            yield chunk
+
+            # 분석 요약 통계 (단일 패스 누적)
+            total_themes = 0
+            total_stocks = 0
+            change_rate_sum = 0.0
+            hot_themes = 0
+
+            try:
+                for theme in itertools.chain((first_theme,), theme_iter):
+                    chunk = orjson.dumps(theme)
+                    if total_themes:
+                        chunk = b',' + chunk
+                    chunks.append(chunk)
+                    yield chunk
+
+                    total_themes += 1
+                    total_stocks += theme.stock_count
+                    change_rate_sum += theme.avg_change_rate
+                    if theme.strength == 'HOT':
+                        hot_themes += 1
+
+            except Exception as e:
+                # 이미 200 응답이 나갔으므로 JSON을 닫으면서 실패로 표시 (캐시 저장 안 함)
+                app.logger.error(f"데이터 분석 실패: {e}")
+                yield b'],"success":false,"message":' + orjson.dumps(f'데이터 분석 실패: {str(e)}') + b'}'
+                return
+
+            analysis_summary = {
+                'date': date_str,
+                'total_themes': total_themes,
+                'total_stocks': total_stocks,
+                'avg_change_rate': round(change_rate_sum / total_themes, 2),
+                'hot_themes': hot_themes,
+                # 본문 생성 시각 (캐시된 본문은 그대로 재전송되므로 응답 시각이 아님)
+                'generated_at': now_str()
+            }
+
+            chunk = (b'],"summary":' + orjson.dumps(analysis_summary)
+                     + b',"success":true,"message":' + orjson.dumps(f'{date_str} 분석이 완료되었습니다.') + b'}')
+            chunks.append(chunk)
+            yield chunk
+
+            if cache_result:
+                with _theme_cache_lock:
+                    analysis_cache[date_str] = _cacheable_body(b''.join(chunks))
+
+            app.logger.info(f"📊 {date_str} 실제 분석 완료: {total_themes}개 테마, {total_stocks}개 종목")
+
+        # 청크가 이미 bytes이므로 werkzeug의 청크별 인코딩 검사 없이 그대로 전송
+        return current_app.response_class(
+            stream_with_context(generate()),
+            mimetype='application/json',
+            direct_passthrough=True
+        )
 
     except Exception as e:
         current_app.logger.error(f"데이터 분석 실패: {e}")
-        return jsonify({
-            'success': False,
-            'message': f'데이터 분석 실패: {str(e)}'
-        }), 500
+        return _message_resp(False, f'데이터 분석 실패: {str(e)}', 500)
 
 
 @top_rate_bp.route('/api/theme-detail')
@@ -238,36 +581,30 @@ def get_theme_detail():
     """테마 상세 정보 조회 (모달용)"""
     try:
         theme_name = request.args.get('theme')
-        date_str = request.args.get('date', get_trading_date())
+        date_str = request.args.get('date') or get_trading_date()
 
         if not theme_name:
-            return jsonify({
-                'success': False,
-                'message': '테마명이 필요합니다.'
-            }), 400
+            return _message_resp(False, '테마명이 필요합니다.', 400)
 
         # 실제 테마 상세 정보 조회
-        theme_detail = db.get_theme_detail(theme_name, date_str)
+        if _dummy_mode():
+            theme_detail = dummy_theme_detail(theme_name, date_str)
+        else:
+            theme_detail = _cached_theme_details([theme_name], date_str).get(theme_name)
 
         if not theme_detail:
-            return jsonify({
-                'success': False,
-                'message': f'{theme_name} 테마 정보를 찾을 수 없습니다.'
-            }), 404
+            return _message_resp(False, f'{theme_name} 테마 정보를 찾을 수 없습니다.', 404)
 
         current_app.logger.info(f"📋 테마 상세 조회: {theme_name} ({date_str})")
 
-        return jsonify({
+        return _resp({
             'success': True,
             'theme_detail': theme_detail
         })
 
     except Exception as e:
         current_app.logger.error(f"테마 상세정보 조회 실패: {e}")
-        return jsonify({
-            'success': False,
-            'message': f'테마 상세정보 조회 실패: {str(e)}'
-        }), 500
+        return _message_resp(False, f'테마 상세정보 조회 실패: {str(e)}', 500)
 
 
 # ============= 📅 데이터 관리 API =============
@@ -276,39 +613,39 @@ def get_theme_detail():
 def get_available_dates():
     """사용 가능한 날짜 목록 조회 (실제 테이블 기반)"""
     try:
-        dates = db.get_available_dates()
+        dates = dummy_available_dates() if _dummy_mode() else _cached_available_dates()
 
-        return jsonify({
+        return _resp({
             'success': True,
             'dates': dates,
             'total_count': len(dates),
             'latest_date': dates[0] if dates else None
         })
     except Exception as e:
-        return jsonify({
+        return _resp({
             'success': False,
             'message': f'날짜 목록 조회 실패: {str(e)}',
             'dates': []
-        }), 500
+        }, 500)
 
 
 @top_rate_bp.route('/api/check-date-data')
 def check_date_data():
     """특정 날짜 데이터 존재 여부 확인 (실제 테이블 확인)"""
     try:
-        date_str = request.args.get('date', get_trading_date())
+        date_str = request.args.get('date') or get_trading_date()
 
         if not date_str:
-            return jsonify({
+            return _resp({
                 'success': False,
                 'message': '날짜가 필요합니다.',
                 'has_data': False
-            }), 400
+            }, 400)
 
-        # 실제 데이터 존재 확인
-        has_data = db.has_data_for_date(date_str)
+        # 실제 데이터 존재 확인 (더미 모드는 항상 있음)
+        has_data = _dummy_mode() or _has_data(date_str)
 
-        return jsonify({
+        return _resp({
             'success': True,
             'date': date_str,
             'has_data': has_data,
@@ -316,39 +653,184 @@ def check_date_data():
         })
 
     except Exception as e:
-        return jsonify({
+        return _resp({
             'success': False,
             'message': f'데이터 확인 실패: {str(e)}',
             'has_data': False
-        }), 500
+        }, 500)
 
 
-# ============= 🖥️ 시스템 모니터링 API =============
+# ============= 📦 일괄 조회 API =============
 
-@top_rate_bp.route('/api/system-status')
-def get_system_status():
-    """실시간 시스템 상태 조회"""
+BATCH_MAX_OPS = 50
+
+# 일괄 조회 날짜 형식 (YYYY-MM-DD, 테이블명 theme_YYYYMMDD의 8자리 숫자로 변환됨)
+_BATCH_DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+# 일괄 조회의 날짜별 DB 조회를 동시에 실행 (DB 연결 풀 크기 안에서 제한)
+batch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='top-rate-batch')
+
+
+def _batch_check_date(op, date_str, batch_state):
+    """일괄 조회: 날짜 데이터 존재 여부 (미리 날짜별로 조회한 결과 사용)"""
+    has_data = batch_state['has_data'][date_str]
+
+    return {
+        'success': True,
+        'date': date_str,
+        'has_data': has_data,
+        'message': f'{date_str} 데이터 {"있음" if has_data else "없음"}'
+    }
+
+
+def _batch_theme_detail(op, date_str, batch_state):
+    """일괄 조회: 테마 상세 정보 (미리 날짜별로 묶어 조회한 결과 사용)"""
+    theme_name = op.get('theme')
+    if not theme_name:
+        return {'success': False, 'message': '테마명이 필요합니다.'}
+
+    theme_detail = batch_state['theme_details'].get(date_str, {}).get(theme_name)
+    if not theme_detail:
+        return {'success': False, 'message': f'{theme_name} 테마 정보를 찾을 수 없습니다.'}
+
+    return {'success': True, 'theme_detail': theme_detail}
+
+
+def _batch_op_error(op) -> Optional[str]:
+    """일괄 조회 요청 하나의 형식 검사 (문제 없으면 None, 잘못된 요청은 해당 결과만 실패 처리)"""
+    date_str = op.get('date')
+    if date_str and not (isinstance(date_str, str) and _BATCH_DATE_RE.fullmatch(date_str)):
+        return '날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)'
+
+    theme_name = op.get('theme')
+    if op.get('op') == 'theme_detail' and theme_name and not isinstance(theme_name, str):
+        return '테마명은 문자열이어야 합니다.'
+
+    return None
+
+
+_BATCH_HANDLERS = {
+    'check_date': _batch_check_date,
+    'theme_detail': _batch_theme_detail
+}
+
+
+@top_rate_bp.route('/api/batch', methods=['POST'])
+def batch_query():
+    """여러 조회 요청을 한 번에 처리 (check_date, theme_detail)"""
     try:
-        status = db.get_system_status()
-
-        # 크롤링 상태 추가
-        status['crawling'] = {
-            'is_running': crawling_progress['is_running'],
-            'last_run': crawling_progress.get('end_time'),
-            'success': crawling_progress.get('success'),
-            'current_progress': crawling_progress['percent']
+        data = request.get_json(silent=True) or {}
+        ops = data.get('ops')
+
+        if not isinstance(ops, list) or not ops:
+            return _message_resp(False, 'ops 목록이 필요합니다.', 400)
+
+        if len(ops) > BATCH_MAX_OPS:
+            return _message_resp(False, f'한 번에 최대 {BATCH_MAX_OPS}개까지 요청할 수 있습니다.', 400)
+
+        ops = [op if isinstance(op, dict) else {} for op in ops]
+        op_errors = [_batch_op_error(op) for op in ops]
+        trading_date = get_trading_date()
+
+        # theme_detail 요청은 날짜별로 묶어 날짜당 쿼리 한 번으로 조회, check_date는 날짜별 한 번만 확인
+        # (형식이 잘못된 요청은 조회 대상에서 제외)
+        themes_by_date = {}
+        check_dates = set()
+        for op, op_error in zip(ops, op_errors):
+            if op_error:
+                continue
+            if op.get('op') == 'theme_detail' and op.get('theme'):
+                themes_by_date.setdefault(op.get('date') or trading_date, []).append(op['theme'])
+            elif op.get('op') == 'check_date':
+                check_dates.add(op.get('date') or trading_date)
+
+        # 날짜별 조회는 서로 독립적이므로 순차 대기 없이 동시에 실행
+        detail_futures = {
+            date_str: batch_executor.submit(_cached_theme_details, theme_names, date_str)
+            for date_str, theme_names in themes_by_date.items()
         }
+        has_data_futures = {date_str: batch_executor.submit(_has_data, date_str) for date_str in check_dates}
 
-        return jsonify({
+        batch_state = {
+            'theme_details': {date_str: future.result() for date_str, future in detail_futures.items()},
+            'has_data': {date_str: future.result() for date_str, future in has_data_futures.items()}
+        }
+
+        results = []
+        for op, op_error in zip(ops, op_errors):
+            if op_error:
+                results.append({'success': False, 'message': op_error})
+                continue
+
+            handler = _BATCH_HANDLERS.get(op.get('op'))
+            if handler is None:
+                results.append({
+                    'success': False,
+                    'message': f'지원하지 않는 요청: {op.get("op")}'
+                })
+                continue
+
+            results.append(handler(op, op.get('date') or trading_date, batch_state))
+
+        return _resp({
             'success': True,
-            'system_status': status
+            'results': results
         })
 
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'message': f'시스템 상태 조회 실패: {str(e)}'
-        }), 500
+        current_app.logger.error(f"일괄 조회 실패: {e}")
+        return _message_resp(False, f'일괄 조회 실패: {str(e)}', 500)
+
+
+# ============= 🖥️ 시스템 모니터링 API =============
+
+# (DB 상태 객체, 진행상황 스냅샷, 합친 상태): 둘 다 같은 객체면 이전 결과 재사용
+_system_status_snapshot = (None, None, {})
+
+
+def _system_status_with_crawling() -> dict:
+    """시스템 상태 + 현재 크롤링 상태 (입력이 바뀔 때만 다시 구성, 호출측에서 수정하지 않음)"""
+    global _system_status_snapshot
+    status, progress = _cached_system_status(), crawling_progress
+    cached_status, cached_progress, combined = _system_status_snapshot
+    if cached_status is not status or cached_progress is not progress:
+        combined = {
+            **status,
+            'crawling': {
+                'is_running': progress.is_running,
+                'last_run': format_timestamp(progress.end_time),
+                'success': progress.success,
+                'current_progress': progress.percent
+            }
+        }
+        _system_status_snapshot = (status, progress, combined)
+    return combined
+
+
+# (합친 상태, 응답 바이트): 같은 상태 객체면 직렬화 결과 재사용
+_system_status_body_cache = (None, b'')
+
+
+def _system_status_body() -> bytes:
+    """시스템 상태 응답 바이트 (상태가 다시 구성됐을 때만 직렬화)"""
+    global _system_status_body_cache
+    system_status = _system_status_with_crawling()
+    cached_status, cached_body = _system_status_body_cache
+    if cached_status is not system_status:
+        cached_body = orjson.dumps({'success': True, 'system_status': system_status},
+                                  default=orjson_default, option=ORJSON_OPTIONS)
+        _system_status_body_cache = (system_status, cached_body)
+    return cached_body
+
+
+@top_rate_bp.route('/api/system-status')
+def get_system_status():
+    """실시간 시스템 상태 조회"""
+    try:
+        return _raw_json(_system_status_body())
+
+    except Exception as e:
+        return _message_resp(False, f'시스템 상태 조회 실패: {str(e)}', 500)
 
 
 @top_rate_bp.route('/api/health-check')
@@ -357,20 +839,20 @@ def health_check():
     try:
         is_healthy = db.test_connection()
 
-        return jsonify({
+        return _resp({
             'success': True,
             'healthy': is_healthy,
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp': now_str(),
             'database': 'connected' if is_healthy else 'disconnected'
         })
 
     except Exception as e:
-        return jsonify({
+        return _resp({
             'success': False,
             'healthy': False,
             'error': str(e),
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }), 500
+            'timestamp': now_str()
+        }, 500)
 
 
 # ============= 🗑️ 데이터 관리 API =============
@@ -379,86 +861,103 @@ def health_check():
 def cleanup_old_data():
     """오래된 데이터 정리"""
     try:
-        data = request.get_json() or {}
+        data = request.get_json(silent=True) or {}
         keep_days = data.get('keep_days', 30)
 
         if keep_days < 7:
-            return jsonify({
-                'success': False,
-                'message': '최소 7일은 보관해야 합니다.'
-            }), 400
+            return _message_resp(False, '최소 7일은 보관해야 합니다.', 400)
 
         success = db.delete_old_data(keep_days)
+        if success:
+            _invalidate_date_caches()
 
-        return jsonify({
-            'success': success,
-            'message': f'{keep_days}일 이전 데이터 정리 {"완료" if success else "실패"}'
-        })
+        return _message_resp(success, f'{keep_days}일 이전 데이터 정리 {"완료" if success else "실패"}')
 
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'message': f'데이터 정리 실패: {str(e)}'
-        }), 500
+        return _message_resp(False, f'데이터 정리 실패: {str(e)}', 500)
 
 
 # ============= 📊 통계 API =============
 
-@top_rate_bp.route('/api/daily-summary')
-def get_daily_summary():
-    """일별 요약 통계"""
+def _build_daily_summary(date_str: str):
+    """일별 요약 통계 구성 (분석 결과가 없으면 None, 날짜별 캐시)"""
+    cache = _date_cache(date_str, _past_daily_summaries, _today_daily_summaries)
+    with _theme_cache_lock:
+        summary = cache.get(date_str)
+    if summary is not None:
+        return summary
+
+    # 요약 통계는 SQL에서 집계 (테마 행 전체를 가져와 여러 번 순회하지 않음)
+    theme_summary = db.get_theme_summary(date_str)
+
+    if not theme_summary:
+        return None
+
+    # 상위 5개 테마
+    top_themes = db.get_top_theme_analysis_results(date_str, limit=5)
+
+    summary = {
+        'date': date_str,
+        **theme_summary,
+        'top_themes': top_themes,
+        'generated_at': now_str()
+    }
+    with _theme_cache_lock:
+        cache[date_str] = summary
+    return summary
+
+
+@top_rate_bp.route('/api/overview')
+def get_overview():
+    """페이지 렌더링에 필요한 정보를 한 번에 조회 (데이터 존재 여부, 시스템 상태, 선택 시 일별 요약)"""
     try:
-        date_str = request.args.get('date', get_trading_date())
+        date_str = request.args.get('date') or get_trading_date()
+        include_summary = request.args.get('summary') == '1'
 
-        if not db.has_data_for_date(date_str):
-            return jsonify({
-                'success': False,
-                'message': f'{date_str} 데이터가 없습니다.'
-            }), 404
+        has_data = _dummy_mode() or _has_data(date_str)
 
-        # 테마 분석 결과 조회
-        themes = db.get_theme_analysis_results(date_str)
+        daily_summary = None
+        if include_summary and has_data and not _dummy_mode():
+            daily_summary = _build_daily_summary(date_str)
 
-        if not themes:
-            return jsonify({
-                'success': False,
-                'message': f'{date_str} 분석 결과가 없습니다.'
-            }), 404
+        return _resp({
+            'success': True,
+            'date': date_str,
+            'has_data': has_data,
+            'daily_summary': daily_summary,
+            'system_status': _system_status_with_crawling()
+        })
 
-        # 요약 통계 계산
-        total_themes = len(themes)
-        total_stocks = sum(theme['stock_count'] for theme in themes)
-        avg_change_rate = sum(theme['avg_change_rate'] for theme in themes) / total_themes
+    except Exception as e:
+        current_app.logger.error(f"개요 조회 실패: {e}")
+        return _resp({
+            'success': False,
+            'message': f'개요 조회 실패: {str(e)}',
+            'has_data': False
+        }, 500)
 
-        # 강도별 분류
-        strength_counts = {}
-        for theme in themes:
-            strength = theme['strength']
-            strength_counts[strength] = strength_counts.get(strength, 0) + 1
 
-        # 상위 5개 테마
-        top_themes = themes[:5]
+@top_rate_bp.route('/api/daily-summary')
+def get_daily_summary():
+    """일별 요약 통계"""
+    try:
+        date_str = request.args.get('date') or get_trading_date()
 
-        summary = {
-            'date': date_str,
-            'total_themes': total_themes,
-            'total_stocks': total_stocks,
-            'avg_change_rate': round(avg_change_rate, 2),
-            'strength_distribution': strength_counts,
-            'top_themes': top_themes,
-            'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
+        if not _has_data(date_str):
+            return _message_resp(False, f'{date_str} 데이터가 없습니다.', 404)
+
+        summary = _build_daily_summary(date_str)
 
-        return jsonify({
+        if not summary:
+            return _message_resp(False, f'{date_str} 분석 결과가 없습니다.', 404)
+
+        return _resp({
             'success': True,
             'daily_summary': summary
         })
 
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'message': f'일별 요약 조회 실패: {str(e)}'
-        }), 500
+        return _message_resp(False, f'일별 요약 조회 실패: {str(e)}', 500)
 
 
 # ============= 🔧 유틸리티 API =============
@@ -469,40 +968,54 @@ def test_db_connection():
     try:
         success = db.test_connection()
 
-        return jsonify({
+        return _raw_json(orjson.dumps({
             'success': success,
             'message': 'DB 연결 성공' if success else 'DB 연결 실패',
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        })
+            'timestamp': now_str()
+        }))
 
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'message': f'DB 연결 테스트 실패: {str(e)}'
-        }), 500
+        return _message_resp(False, f'DB 연결 테스트 실패: {str(e)}', 500)
 
 
 @top_rate_bp.route('/api/module-info')
 def get_module_info():
     """모듈 정보 조회"""
-    return jsonify({
+    return _raw_json(orjson.dumps({
         'success': True,
-        'module_info': {
-            'name': '등락율상위분석',
-            'version': '4.0.0',
-            'description': '실제 네이버 금융 크롤링 기반 테마 분석',
-            'features': [
-                '실시간 테마별 상위 종목 크롤링',
-                '종목별 뉴스 5개씩 수집',
-                'MySQL 데이터베이스 저장',
-                '테마별 분석 결과 제공',
-                '실시간 진행상황 모니터링'
-            ],
-            'data_source': 'Naver Finance',
-            'update_frequency': '사용자 요청시',
-            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
-    })
+        'module_info': {**_MODULE_INFO, 'last_updated': now_str()}
+    }))
+
+
+# 모듈 정보 고정값 (last_updated만 요청별로 추가)
+_MODULE_INFO = {
+    'name': '등락율상위분석',
+    'version': '4.0.0',
+    'description': '실제 네이버 금융 크롤링 기반 테마 분석',
+    'features': [
+        '실시간 테마별 상위 종목 크롤링',
+        '종목별 뉴스 5개씩 수집',
+        'MySQL 데이터베이스 저장',
+        '테마별 분석 결과 제공',
+        '실시간 진행상황 모니터링'
+    ],
+    'data_source': 'Naver Finance',
+    'update_frequency': '사용자 요청시'
+}
+
+
+# 고정 응답 본문 (import 시 한 번만 직렬화)
+_RESET_PROGRESS_BODY = orjson.dumps({'success': True, 'message': '진행상황 리셋 완료'})
+_NOT_FOUND_BODY = orjson.dumps({
+    'success': False,
+    'error': 'Not Found',
+    'message': '요청한 리소스를 찾을 수 없습니다.'
+})
+_INTERNAL_ERROR_BODY = orjson.dumps({
+    'success': False,
+    'error': 'Internal Server Error',
+    'message': '서버 내부 오류가 발생했습니다.'
+})
 
 
 # ============= 🚨 에러 핸들러 =============
@@ -510,56 +1023,52 @@ def get_module_info():
 @top_rate_bp.errorhandler(404)
 def not_found_error(error):
     """404 에러 처리"""
-    return jsonify({
-        'success': False,
-        'error': 'Not Found',
-        'message': '요청한 리소스를 찾을 수 없습니다.'
-    }), 404
+    return _raw_json(_NOT_FOUND_BODY, 404)
 
 
 @top_rate_bp.errorhandler(500)
 def internal_error(error):
     """500 에러 처리"""
-    return jsonify({
-        'success': False,
-        'error': 'Internal Server Error',
-        'message': '서버 내부 오류가 발생했습니다.'
-    }), 500
+    return _raw_json(_INTERNAL_ERROR_BODY, 500)
 
 
-# ============= 개발자 도구 (개발 모드 전용) =============
+# ============= 개발자 도구 (개발 모드 전용, register_module에서 DEBUG일 때만 등록) =============
 
-@top_rate_bp.route('/api/dev/force-crawl/<date>')
+@top_rate_dev_bp.route('/api/dev/force-crawl/<date>')
 def dev_force_crawl(date):
     """개발용: 강제 크롤링 (특정 날짜)"""
-    if not current_app.config.get('DEBUG', False):
-        return jsonify({'error': 'Development mode only'}), 403
-
     try:
-        crawler_instance = TopRateCrawler()
-        success = crawler_instance.crawl_and_save(date)
-
-        return jsonify({
-            'success': success,
-            'message': f'{date} 강제 크롤링 {"성공" if success else "실패"}'
-        })
+        # 같은 날짜가 진행 중이면 그 결과를 기다리고, 아니면 같은 실행기에서 순서대로 실행
+        def run_crawling():
+            with db.crawl_lock() as acquired:
+                # 잠금 미획득(다른 프로세스에서 크롤링 중)은 실패와 구분해 None 반환
+                if not acquired:
+                    return None
+                success = TopRateCrawler().crawl_and_save(date)
+            if success:
+                _invalidate_date_caches()
+            return success
+
+        future = _crawl_in_flight(date) or _submit_crawl(date, run_crawling)
+        success = future.result()
+
+        if success is None:
+            return _message_resp(False, '이미 크롤링이 실행 중입니다.', 409)
+
+        return _message_resp(success, f'{date} 강제 크롤링 {"성공" if success else "실패"}')
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _resp({'success': False, 'error': str(e)}, 500)
 
 
-@top_rate_bp.route('/api/dev/reset-progress')
+@top_rate_dev_bp.route('/api/dev/reset-progress')
 def dev_reset_progress():
     """개발용: 진행상황 리셋"""
-    if not current_app.config.get('DEBUG', False):
-        return jsonify({'error': 'Development mode only'}), 403
-
-    global crawling_progress
-    crawling_progress.update({
-        'is_running': False,
-        'percent': 0,
-        'message': '대기 중',
-        'success': None,
-        'error_message': ''
-    })
-
-    return jsonify({'success': True, 'message': '진행상황 리셋 완료'})
\ No newline at end of file
+    _update_progress(
+        is_running=False,
+        percent=0,
+        message='대기 중',
+        success=None,
+        error_message=''
+    )
+
+    return _raw_json(_RESET_PROGRESS_BODY)
\ No newline at end of file
@@ -8,18 +8,46 @@
 - 유연한 스케줄 관리
 """
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from apscheduler.schedulers.background import BackgroundScheduler
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from apscheduler.executors.pool import ThreadPoolExecutor
 import os
 
+try:
+    import holidays
+except ImportError:  # holidays 미설치 시 주말만 휴일로 처리
+    holidays = None
+
 from .crawler import TopRateCrawler
+from .database import TopRateDatabase
 from .utils import get_trading_date
 
 
+@lru_cache(maxsize=4)
+def _holidays_for_year(year: int) -> FrozenSet:
+    """해당 연도 한국 공휴일 날짜 집합 (연도당 한 번만 생성, 이후 조회는 집합 멤버십 확인)"""
+    if holidays is None:
+        return frozenset()
+    return frozenset(holidays.country_holidays('KR', years=year))
+
+
+@dataclass(slots=True)
+class ScheduleEntry:
+    """활성 스케줄 상태 (active_schedules 값, 토글 시 enabled만 변경)"""
+    hour: int
+    minute: int
+    name: str
+    enabled: bool
+    next_run: Optional[datetime]
+
+
 class TopRateScheduler:
     """등락율상위분석 자동 스케줄러"""
 
@@ -28,6 +56,11 @@ class TopRateScheduler:
         self.scheduler = None
         self.is_running = False
 
+        # 스케줄러 이벤트 루프와 크롤링 실행용 쓰레드 풀 (_setup_scheduler에서 생성)
+        self._loop = None
+        self._loop_thread = None
+        self._crawl_executor = None
+
         # 기본 스케줄 설정
         self.default_schedules = [
             {'hour': 9, 'minute': 15, 'enabled': True, 'name': '장시작후'},
@@ -35,18 +68,31 @@ class TopRateScheduler:
             {'hour': 17, 'minute': 30, 'enabled': False, 'name': '장마감후'}
         ]
 
-        # 활성 스케줄 저장
-        self.active_schedules = {}
+        # 활성 스케줄 저장 (작업 ID → ScheduleEntry, 추가 시 (시, 분) 순으로 유지)
+        self.active_schedules: Dict[str, ScheduleEntry] = {}
+
+        # 크롤러는 실행마다 새로 만들지 않고 재사용 (DB/HTTP 세션 설정 공유)
+        self._crawler = None
 
         self._setup_scheduler()
 
+    def _get_crawler(self) -> TopRateCrawler:
+        """재사용할 크롤러 인스턴스 반환 (첫 실행 시 생성)"""
+        if self._crawler is None:
+            self._crawler = TopRateCrawler()
+        return self._crawler
+
     def _setup_scheduler(self):
         """스케줄러 설정"""
         try:
-            # ThreadPool 실행자 설정
-            executors = {
-                'default': ThreadPoolExecutor(20),
-            }
+            # 크롤링 실행용 쓰레드 풀
+            # 작업은 하루 몇 번 실행되는 크롤링뿐이고 crawl_lock으로 한 번에 하나만 돌므로
+            # 스케줄 수 + 여유분만큼만 쓰레드 확보 (코어 수 초과 금지, 쓰레드는 실행 시에만 생성)
+            max_workers = max(2, min(len(self.default_schedules) + 2, os.cpu_count() or 4))
+            self._crawl_executor = ThreadPoolExecutor(max_workers, thread_name_prefix='top-rate-scheduled-crawl')
+
+            # 트리거 대기는 이벤트 루프 하나에서 처리 (start()에서 루프 쓰레드 시작)
+            self._loop = asyncio.new_event_loop()
 
             # 작업 기본 설정
             job_defaults = {
@@ -55,8 +101,8 @@ class TopRateScheduler:
                 'misfire_grace_time': 300  # 5분 지연 허용
             }
 
-            self.scheduler = BackgroundScheduler(
-                executors=executors,
+            self.scheduler = AsyncIOScheduler(
+                event_loop=self._loop,
                 job_defaults=job_defaults,
                 timezone='Asia/Seoul'
             )
@@ -91,10 +137,21 @@ class TopRateScheduler:
         except Exception as e:
             app.logger.error(f"❌ TopRateScheduler 초기화 실패: {e}")
 
+    def _ensure_loop_thread(self):
+        """스케줄러 이벤트 루프 쓰레드 시작 (프로세스당 한 번)"""
+        if self._loop_thread is None or not self._loop_thread.is_alive():
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever,
+                name='top-rate-scheduler-loop',
+                daemon=True
+            )
+            self._loop_thread.start()
+
     def start(self):
         """스케줄러 시작"""
         try:
             if not self.is_running:
+                self._ensure_loop_thread()
                 self.scheduler.start()
                 self.is_running = True
                 logging.info("🚀 자동 스케줄러 시작")
@@ -134,29 +191,31 @@ class TopRateScheduler:
                 raise Exception("스케줄러가 초기화되지 않았습니다")
 
             # 작업 ID 생성
-            job_id = f"auto_crawling_{hour:02d}_{minute:02d}"
-
-            # 기존 작업이 있으면 제거
-            if job_id in self.active_schedules:
-                self.remove_schedule(job_id)
+            job_id = self._job_id(hour, minute)
 
-            # 새 스케줄 추가
+            # 새 스케줄 추가 (같은 ID의 기존 작업은 제거 후 재등록 대신 그 자리에서 교체)
             job = self.scheduler.add_job(
                 func=self._scheduled_crawling,
                 trigger=CronTrigger(hour=hour, minute=minute),
                 id=job_id,
                 name=name or f"자동수집 {hour:02d}:{minute:02d}",
-                args=[name or f"{hour:02d}:{minute:02d}"]
+                args=[name or f"{hour:02d}:{minute:02d}"],
+                replace_existing=True
             )
 
-            # 활성 스케줄에 저장
-            self.active_schedules[job_id] = {
-                'hour': hour,
-                'minute': minute,
-                'name': name or f"{hour:02d}:{minute:02d}",
-                'enabled': True,
-                'next_run': job.next_run_time
-            }
+            # 활성 스케줄에 저장 (추가는 드물므로 여기서 시간순으로 재구성, 조회 시 정렬 없음)
+            self.active_schedules[job_id] = ScheduleEntry(
+                hour=hour,
+                minute=minute,
+                name=name or f"{hour:02d}:{minute:02d}",
+                enabled=True,
+                # 스케줄러 시작 전에 등록한 작업(대기 작업)은 아직 next_run_time 속성이 없음
+                next_run=getattr(job, 'next_run_time', None)
+            )
+            self.active_schedules = dict(sorted(
+                self.active_schedules.items(),
+                key=lambda item: (item[1].hour, item[1].minute)
+            ))
 
             logging.info(f"✅ 스케줄 추가: {name or job_id} ({hour:02d}:{minute:02d})")
             return job_id
@@ -165,6 +224,11 @@ class TopRateScheduler:
             logging.error(f"❌ 스케줄 추가 실패: {e}")
             return ""
 
+    @staticmethod
+    def _job_id(hour: int, minute: int) -> str:
+        """시각별 자동수집 작업 ID"""
+        return f"auto_crawling_{hour:02d}_{minute:02d}"
+
     def remove_schedule(self, job_id: str) -> bool:
         """
         스케줄 제거
@@ -181,7 +245,7 @@ class TopRateScheduler:
                 self.scheduler.remove_job(job_id)
 
                 # 활성 스케줄에서 제거
-                schedule_name = self.active_schedules[job_id]['name']
+                schedule_name = self.active_schedules[job_id].name
                 del self.active_schedules[job_id]
 
                 logging.info(f"✅ 스케줄 제거: {schedule_name}")
@@ -211,19 +275,19 @@ class TopRateScheduler:
 
             schedule = self.active_schedules[job_id]
 
-            if schedule['enabled']:
+            if schedule.enabled:
                 # 비활성화
                 self.scheduler.pause_job(job_id)
-                schedule['enabled'] = False
+                schedule.enabled = False
                 status = "비활성화"
             else:
                 # 활성화
                 self.scheduler.resume_job(job_id)
-                schedule['enabled'] = True
+                schedule.enabled = True
                 status = "활성화"
 
-            logging.info(f"🔄 스케줄 {status}: {schedule['name']}")
-            return schedule['enabled']
+            logging.info(f"🔄 스케줄 {status}: {schedule.name}")
+            return schedule.enabled
 
         except Exception as e:
             logging.error(f"❌ 스케줄 토글 실패: {e}")
@@ -238,16 +302,19 @@ class TopRateScheduler:
         """
         schedules = []
 
+        # 작업 목록은 한 번만 조회 (작업마다 get_job으로 잡스토어 잠금을 반복하지 않음)
+        jobs_by_id = {job.id: job for job in self.scheduler.get_jobs()}
+
         for job_id, schedule in self.active_schedules.items():
             try:
                 # 스케줄러에서 실제 작업 정보 가져오기
-                job = self.scheduler.get_job(job_id)
+                job = jobs_by_id.get(job_id)
 
                 schedule_info = {
                     'id': job_id,
-                    'name': schedule['name'],
-                    'time': f"{schedule['hour']:02d}:{schedule['minute']:02d}",
-                    'enabled': schedule['enabled'],
+                    'name': schedule.name,
+                    'time': f"{schedule.hour:02d}:{schedule.minute:02d}",
+                    'enabled': schedule.enabled,
                     'next_run': job.next_run_time.strftime('%Y-%m-%d %H:%M:%S') if job and job.next_run_time else None
                 }
 
@@ -257,29 +324,47 @@ class TopRateScheduler:
                 logging.warning(f"스케줄 정보 조회 실패 ({job_id}): {e}")
                 continue
 
-        # 시간순 정렬
-        schedules.sort(key=lambda x: (x['time']))
+        # active_schedules가 이미 시간순이므로 별도 정렬 없음
         return schedules
 
-    def _scheduled_crawling(self, schedule_name: str):
+    async def _scheduled_crawling(self, schedule_name: str):
+        """
+        스케줄된 크롤링 실행 (이벤트 루프에서 호출, 블로킹 작업은 쓰레드 풀로 넘김)
+
+        Args:
+            schedule_name: 스케줄 이름
+        """
+        # 휴일/주말/장외시간이면 쓰레드 풀, DB 잠금, 크롤러를 건드리기 전에 종료
+        skip, reason = self.should_skip_crawling()
+        if skip:
+            logging.info(f"⏭️ 자동 크롤링 건너뜀 ({schedule_name}): {reason}")
+            return
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._crawl_executor, self._run_scheduled_crawling, schedule_name)
+
+    def _run_scheduled_crawling(self, schedule_name: str):
         """
-        스케줄된 크롤링 실행
+        스케줄된 크롤링 본체 (크롤링 쓰레드 풀에서 실행)
 
         Args:
             schedule_name: 스케줄 이름
         """
         start_time = datetime.now()
 
-        try:
-            # 거래일 기준 날짜 계산
-            target_date = get_trading_date()
+        # 거래일 기준 날짜 계산 (시작 시각을 그대로 사용해 시계 재조회 없음, 실패 알림에도 같은 날짜 사용)
+        target_date = get_trading_date(start_time)
 
+        try:
             logging.info(f"🤖 자동 크롤링 시작 ({schedule_name})")
             logging.info(f"📅 대상 날짜: {target_date}")
 
-            # 크롤러 실행
-            crawler = TopRateCrawler()
-            success = crawler.crawl_and_save(target_date)
+            # 크롤러 실행 (워커 프로세스마다 스케줄러가 있어도 DB 잠금을 얻은 한 곳만 실행)
+            with TopRateDatabase().crawl_lock() as acquired:
+                if not acquired:
+                    logging.info(f"⏭️ 다른 프로세스에서 크롤링 실행 중 - 건너뜀 ({schedule_name})")
+                    return
+                success = self._get_crawler().crawl_and_save(target_date)
 
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
@@ -296,7 +381,7 @@ class TopRateScheduler:
             duration = (end_time - start_time).total_seconds()
 
             logging.error(f"❌ 자동 크롤링 오류 ({schedule_name}): {e}")
-            self._send_notification(False, schedule_name, get_trading_date(), duration, str(e))
+            self._send_notification(False, schedule_name, target_date, duration, str(e))
 
     def _send_notification(self, success: bool, schedule_name: str, date: str, duration: float, error: str = None):
         """
@@ -340,8 +425,11 @@ class TopRateScheduler:
             logging.info(f"🖱️ 수동 크롤링 시작 (날짜: {target_date})")
 
             # 크롤러 실행
-            crawler = TopRateCrawler()
-            success = crawler.crawl_and_save(target_date)
+            with TopRateDatabase().crawl_lock() as acquired:
+                if not acquired:
+                    logging.warning("⚠️ 다른 프로세스에서 크롤링 실행 중")
+                    return False
+                success = self._get_crawler().crawl_and_save(target_date)
 
             if success:
                 logging.info(f"✅ 수동 크롤링 완료 (날짜: {target_date})")
@@ -363,16 +451,19 @@ class TopRateScheduler:
         """
         next_runs = {}
 
+        # 작업 목록은 한 번만 조회 (작업마다 get_job으로 잡스토어 잠금을 반복하지 않음)
+        jobs_by_id = {job.id: job for job in self.scheduler.get_jobs()}
+
         for job_id, schedule in self.active_schedules.items():
             try:
-                job = self.scheduler.get_job(job_id)
-                if job and job.next_run_time and schedule['enabled']:
-                    next_runs[schedule['name']] = job.next_run_time.strftime('%Y-%m-%d %H:%M:%S')
+                job = jobs_by_id.get(job_id)
+                if job and job.next_run_time and schedule.enabled:
+                    next_runs[schedule.name] = job.next_run_time.strftime('%Y-%m-%d %H:%M:%S')
                 else:
-                    next_runs[schedule['name']] = "비활성화"
+                    next_runs[schedule.name] = "비활성화"
 
             except Exception:
-                next_runs[schedule['name']] = "오류"
+                next_runs[schedule.name] = "오류"
 
         return next_runs
 
@@ -393,11 +484,8 @@ class TopRateScheduler:
         if date.weekday() >= 5:
             return True
 
-        # 여기에 한국 공휴일 체크 로직 추가 가능
-        # - 신정, 설날, 삼일절, 어린이날 등
-        # - 외부 API 또는 라이브러리 활용
-
-        return False
+        # 공휴일 체크 (연도별로 한 번 만든 집합에서 조회)
+        return date.date() in _holidays_for_year(date.year)
 
     def should_skip_crawling(self) -> Tuple[bool, str]:
         """
@@ -430,18 +518,22 @@ class TopRateScheduler:
             업데이트 성공 여부
         """
         try:
-            # 기존 스케줄 모두 제거
-            for job_id in list(self.active_schedules.keys()):
-                self.remove_schedule(job_id)
-
-            # 새 스케줄 추가
+            # 새 설정의 활성 스케줄 (작업 ID → 시, 분, 이름)
+            desired = {}
             for schedule in schedules:
                 if schedule.get('enabled', False):
-                    self.add_schedule(
-                        hour=schedule['hour'],
-                        minute=schedule['minute'],
-                        name=schedule.get('name', f"{schedule['hour']:02d}:{schedule['minute']:02d}")
-                    )
+                    hour, minute = schedule['hour'], schedule['minute']
+                    desired[self._job_id(hour, minute)] = (hour, minute, schedule.get('name', f"{hour:02d}:{minute:02d}"))
+
+            # 전부 지우고 다시 등록하지 않고 바뀐 스케줄만 반영 (같은 설정 재적용 시 잡스토어 변경 없음)
+            for job_id in [job_id for job_id in self.active_schedules if job_id not in desired]:
+                self.remove_schedule(job_id)
+
+            for job_id, (hour, minute, name) in desired.items():
+                current = self.active_schedules.get(job_id)
+                if current and current.enabled and current.name == name:
+                    continue
+                self.add_schedule(hour=hour, minute=minute, name=name)
 
             logging.info(f"✅ 스케줄 설정 업데이트 완료: {len(schedules)}개")
             return True
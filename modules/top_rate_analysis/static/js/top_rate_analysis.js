@@ -15,6 +15,7 @@ class TopRateAnalysis {
         this.isCollecting = false;
         this.isAnalyzing = false;
         this.progressInterval = null;
+        this.progressStream = null;
         this.systemMonitorInterval = null;
         
         // 캐시
@@ -127,7 +128,12 @@ class TopRateAnalysis {
             });
 
             if (response.success) {
-                this.addLog(`✅ ${response.target_date} 데이터 수집이 시작되었습니다.`, 'success');
+                if (response.already_running) {
+                    // 같은 날짜 수집이 진행 중이면 새로 시작하지 않고 기존 진행상황을 이어서 표시
+                    this.addLog(`ℹ️ ${response.message}`, 'info');
+                } else {
+                    this.addLog(`✅ ${response.target_date} 데이터 수집이 시작되었습니다.`, 'success');
+                }
                 this.startProgressMonitoring();
             } else {
                 throw new Error(response.message);
@@ -141,6 +147,46 @@ class TopRateAnalysis {
     }
 
     startProgressMonitoring() {
+        // SSE 지원 시 변경될 때만 푸시 받기, 아니면 폴링
+        if (!window.EventSource) {
+            this.startProgressPolling();
+            return;
+        }
+
+        this.progressStream = new EventSource(`${this.apiPrefix}/progress-stream`);
+
+        this.progressStream.onmessage = (event) => {
+            const progress = JSON.parse(event.data);
+            this.updateProgress(progress);
+
+            // 완료 확인
+            if (!progress.is_running) {
+                this.stopProgressStream();
+                this.onCollectionComplete(progress);
+            }
+        };
+
+        this.progressStream.onerror = () => {
+            // 재연결 중이면 브라우저에 맡기고, 완전히 닫힌 경우에만 폴링으로 전환
+            if (this.progressStream && this.progressStream.readyState === EventSource.CLOSED) {
+                this.stopProgressStream();
+                this.startProgressPolling();
+            }
+        };
+    }
+
+    stopProgressStream() {
+        if (this.progressStream) {
+            this.progressStream.close();
+            this.progressStream = null;
+        }
+    }
+
+    startProgressPolling() {
+        if (this.progressInterval) {
+            return;
+        }
+
         this.progressInterval = setInterval(async () => {
             try {
                 const response = await this.apiCall('/crawling-progress');
@@ -566,15 +612,18 @@ class TopRateAnalysis {
             // 기존 결과 초기화
             this.clearAnalysisResults();
 
-            // 새 날짜 데이터 확인
-            const hasData = await this.checkDataExists(this.currentDate);
+            // 새 날짜 데이터 확인 (기존 분석 요약 포함, 요청 한 번)
+            const overview = await this.loadOverview(this.currentDate, true);
 
-            if (hasData) {
+            if (overview?.has_data) {
                 this.showAnalyzeButton();
                 this.addLog(`💡 ${this.currentDate} 데이터가 있습니다. 분석 버튼을 클릭하세요.`, 'success');
                 
-                // 기존 분석 결과가 있다면 자동 로드
-                this.loadExistingAnalysis();
+                // 기존 분석 결과가 있다면 자동 표시
+                if (overview.daily_summary) {
+                    this.addLog('📊 기존 분석 결과를 불러왔습니다.', 'info');
+                    this.displayQuickSummary(overview.daily_summary);
+                }
             } else {
                 this.hideAnalyzeButton();
                 this.addLog(`ℹ️ ${this.currentDate} 데이터가 없습니다. 먼저 데이터를 수집하세요.`, 'info');
@@ -622,12 +671,13 @@ class TopRateAnalysis {
     // ============= 🖥️ 시스템 모니터링 =============
 
     startSystemMonitoring() {
-        // 초기 상태 로드
-        this.refreshSystemStatus();
+        // 초기 상태는 loadInitialData의 개요 조회로 로드됨
 
-        // 30초마다 시스템 상태 확인
+        // 30초마다 시스템 상태 확인 (탭이 보이지 않을 때는 건너뜀)
         this.systemMonitorInterval = setInterval(() => {
-            this.refreshSystemStatus();
+            if (!document.hidden) {
+                this.refreshSystemStatus();
+            }
         }, 30000);
     }
 
@@ -832,16 +882,33 @@ class TopRateAnalysis {
     async refreshData() {
         this.addLog('🔄 데이터를 새로고침합니다...', 'info');
         await this.loadInitialData();
-        await this.refreshSystemStatus();
         this.showToast('데이터 새로고침 완료', 'success');
     }
 
+    async loadOverview(date, includeSummary = false) {
+        // 데이터 존재 여부 + 시스템 상태 (+ 일별 요약)를 한 번에 조회
+        try {
+            const params = includeSummary ? { date, summary: 1 } : { date };
+            const response = await this.apiCall('/overview', 'GET', null, params);
+
+            if (response.success) {
+                this.systemStatus = response.system_status;
+                this.updateSystemStatusDisplay();
+                return response;
+            }
+        } catch (error) {
+            console.error('개요 조회 실패:', error);
+            this.updateSystemStatusDisplay(true);
+        }
+        return null;
+    }
+
     async loadInitialData() {
         try {
-            // 현재 날짜의 분석 결과가 있는지 확인
-            const hasData = await this.checkDataExists(this.currentDate);
+            // 현재 날짜의 분석 결과가 있는지 확인 (시스템 상태 함께 로드)
+            const overview = await this.loadOverview(this.currentDate);
 
-            if (hasData) {
+            if (overview?.has_data) {
                 this.showAnalyzeButton();
                 this.addLog(`💡 ${this.currentDate} 데이터가 있습니다.`, 'success');
             } else {
@@ -866,6 +933,8 @@ class TopRateAnalysis {
             this.progressInterval = null;
         }
 
+        this.stopProgressStream();
+
         if (this.systemMonitorInterval) {
             clearInterval(this.systemMonitorInterval);
             this.systemMonitorInterval = null;
@@ -887,6 +956,7 @@ class TopRateAnalysis {
             themeResults: this.themeResults,
             systemStatus: this.systemStatus,
             progressInterval: !!this.progressInterval,
+            progressStream: !!this.progressStream,
             systemMonitorInterval: !!this.systemMonitorInterval
         };
     }
@@ -9,11 +9,19 @@
 """
 
 import re
-import requests
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Tuple
+import time
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Mapping
 import logging
 
+# 행마다 호출되는 파싱 함수용 정규식/변환 테이블 (import 시 한 번만 생성)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_STOCK_CODE_RE = re.compile(r'^\d{6}$')
+_PERCENT_STRIP_TABLE = str.maketrans('', '', '%,')
+
 
 def get_trading_date(target_time: Optional[datetime] = None) -> str:
     """
@@ -26,21 +34,53 @@ def get_trading_date(target_time: Optional[datetime] = None) -> str:
         YYYY-MM-DD 형식의 거래일 날짜
     """
     if target_time is None:
-        target_time = datetime.now()
+        # 현재 시간 기준은 분 단위로 캐시 (8시 경계도 분 단위이므로 결과 동일)
+        return _trading_date_for_minute(int(time.time() // 60))
 
     if target_time.hour < 8:  # 오전 8시 이전
         trading_date = target_time - timedelta(days=1)
     else:
         trading_date = target_time
 
-    return trading_date.strftime('%Y-%m-%d')
+    # strftime 대신 date.isoformat (같은 YYYY-MM-DD 결과)
+    return trading_date.date().isoformat()
+
+
+@lru_cache(maxsize=8)
+def _trading_date_for_minute(minute_bucket: int) -> str:
+    """분 단위 시각의 거래일 계산 (get_trading_date 캐시용)"""
+    return get_trading_date(datetime.fromtimestamp(minute_bucket * 60))
+
+
+# (초, 포맷 문자열) 튜플을 통째로 교체하므로 읽는 쪽에서 짝이 어긋나지 않음
+_now_str_cache = (0, '')
+
+
+def now_str() -> str:
+    """현재 시각 'YYYY-MM-DD HH:MM:SS' 문자열 (같은 초 안에서는 포맷 결과 재사용)"""
+    global _now_str_cache
+    now_sec = int(time.time())
+    cached_sec, cached_str = _now_str_cache
+    if now_sec != cached_sec:
+        cached_str = datetime.fromtimestamp(now_sec).strftime('%Y-%m-%d %H:%M:%S')
+        _now_str_cache = (now_sec, cached_str)
+    return cached_str
+
+
+@lru_cache(maxsize=16)
+def format_timestamp(epoch: Optional[float]) -> Optional[str]:
+    """epoch 초를 'YYYY-MM-DD HH:MM:SS' 문자열로 변환 (None은 그대로, 같은 시각은 캐시 재사용)"""
+    if epoch is None:
+        return None
+    return datetime.fromtimestamp(epoch).strftime('%Y-%m-%d %H:%M:%S')
 
 
 def format_date_for_display(date_str: str) -> str:
     """날짜를 표시용으로 포맷"""
     try:
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-        return date_obj.strftime('%Y년 %m월 %d일')
+        # strptime 포맷 해석 없이 ISO 날짜 직접 파싱
+        date_obj = date.fromisoformat(date_str)
+        return f"{date_obj.year}년 {date_obj.month:02d}월 {date_obj.day:02d}일"
     except:
         return date_str
 
@@ -55,8 +95,8 @@ def clean_text(text: str) -> str:
     """텍스트 정리"""
     if not text:
         return ""
-    text = re.sub(r'<[^>]+>', '', text)
-    text = re.sub(r'\s+', ' ', text)
+    text = _HTML_TAG_RE.sub('', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     return text.strip()
 
 
@@ -64,13 +104,36 @@ def parse_percentage(text: str) -> float:
     """텍스트에서 퍼센트 값 추출"""
     if not text:
         return 0.0
-    clean_text_str = str(text).replace('%', '').replace(',', '').strip()
+    clean_text_str = str(text).translate(_PERCENT_STRIP_TABLE).strip()
     try:
         return float(clean_text_str)
     except ValueError:
         return 0.0
 
 
+# 테마 키워드별 아이콘 (앞쪽 키워드가 우선)
+THEME_ICONS = (
+    ('증권', '🏦'), ('AI반도체', '🤖'), ('2차전지', '🔋'),
+    ('AI', '🤖'), ('반도체', '💾'), ('바이오', '🧬'),
+    ('게임', '🎮'), ('자동차', '🚗'), ('화학', '⚗️'),
+    ('조선', '🚢'), ('항공', '✈️'), ('건설', '🏗️'),
+    ('통신', '📡'), ('은행', '🏛️'), ('헬스케어', '🏥'),
+    ('엔터테인먼트', '🎭'), ('코로나19', '🦠'),
+    ('K-pop', '🎵'), ('메타버스', '🌐'), ('전기차', '⚡'),
+    ('친환경', '🌱'), ('우주항공', '🚀'), ('로봇', '🤖'),
+    ('VR', '🥽'), ('AR', '🥽'), ('블록체인', '⛓️'), ('가상화폐', '₿')
+)
+
+
+@lru_cache(maxsize=1024)
+def get_theme_icon(theme_name: str) -> str:
+    """테마명 키워드로 아이콘 반환 (테마명별 결과 캐싱)"""
+    for keyword, icon in THEME_ICONS:
+        if keyword in theme_name:
+            return icon
+    return '📈'  # 기본 아이콘
+
+
 def calculate_theme_stats(theme_data: Dict) -> Dict:
     """
     🔥 테마 통계 계산 (올바른 구현)
@@ -93,26 +156,8 @@ def calculate_theme_stats(theme_data: Dict) -> Dict:
             'icon': '📈'  # 기본 아이콘
         }
 
-        # 아이콘 매핑
-        icon_mapping = {
-            '증권': '🏦', 'AI반도체': '🤖', '2차전지': '🔋',
-            'AI': '🤖', '반도체': '💾', '바이오': '🧬',
-            '게임': '🎮', '자동차': '🚗', '화학': '⚗️',
-            '조선': '🚢', '항공': '✈️', '건설': '🏗️',
-            '통신': '📡', '은행': '🏛️', '헬스케어': '🏥',
-            '엔터테인먼트': '🎭', '코로나19': '🦠',
-            'K-pop': '🎵', '메타버스': '🌐', '전기차': '⚡',
-            '친환경': '🌱', '우주항공': '🚀', '로봇': '🤖',
-            'VR/AR': '🥽', 'VR': '🥽', 'AR': '🥽',
-            '블록체인': '⛓️', '가상화폐': '₿'
-        }
-
         # 테마명에서 아이콘 찾기
-        theme_name = stats['theme_name']
-        for keyword, icon in icon_mapping.items():
-            if keyword in theme_name:
-                stats['icon'] = icon
-                break
+        stats['icon'] = get_theme_icon(stats['theme_name'])
 
         # 상승 비율 계산
         if stats['stock_count'] > 0:
@@ -140,18 +185,22 @@ def validate_stock_code(stock_code: str) -> bool:
     """종목코드 유효성 검증"""
     if not stock_code:
         return False
-    return bool(re.match(r'^\d{6}$', stock_code.strip()))
-
-
-def get_default_headers() -> Dict[str, str]:
-    """기본 HTTP 헤더 반환"""
-    return {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive'
-    }
+    return bool(_STOCK_CODE_RE.match(stock_code.strip()))
+
+
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive'
+}
+
+
+@lru_cache(maxsize=1)
+def get_default_headers() -> Mapping[str, str]:
+    """기본 HTTP 헤더 반환 (읽기 전용 공유 객체, 수정하려면 dict()로 복사)"""
+    return MappingProxyType(_DEFAULT_HEADERS)
 
 
 # 상수 정의
@@ -1,481 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-등락율상위분석 Flask Blueprint Routes (더미 데이터 포함 최종판)
-- 모든 API 엔드포인트 완전 구현
-- 테스트용 더미 데이터 제공
-- 400 오류 해결
-"""
-
-import json
-import logging
-import threading
-from datetime import datetime
-from flask import Blueprint, render_template, request, jsonify, current_app
-
-from .database import TopRateDatabase
-from .utils import get_trading_date, get_table_name, calculate_theme_stats, format_date_for_display
-
-# Blueprint 생성
-top_rate_bp = Blueprint(
-    'top_rate',
-    __name__,
-    template_folder='templates',
-    static_folder='static',
-    static_url_path='/top_rate_static'
-)
-
-# 전역 변수
-db = TopRateDatabase()
-
-# 진행상황 추적
-crawling_progress = {
-    'is_running': False,
-    'percent': 0,
-    'message': '대기 중',
-    'start_time': None,
-    'end_time': None,
-    'success': None,
-    'error_message': ''
-}
-
-
-# ============= 페이지 라우트 =============
-
-@top_rate_bp.route('/')
-def index():
-    """등락율상위분석 메인 페이지"""
-    try:
-        # 현재 거래일 계산
-        trading_date = get_trading_date()
-
-        # 사용 가능한 날짜 목록
-        available_dates = db.get_available_dates()
-
-        context = {
-            'current_date': trading_date,
-            'available_dates': available_dates,
-            'page_title': '등락율상위분석'
-        }
-
-        return render_template('top_rate_analysis.html', **context)
-
-    except Exception as e:
-        current_app.logger.error(f"메인 페이지 로드 실패: {e}")
-        return f"페이지 로드 오류: {e}", 500
-
-
-# ============= 🔥 분석 실행 API (더미 데이터 포함) =============
-
-@top_rate_bp.route('/api/analyze', methods=['POST'])
-def analyze_data():
-    """분석 실행 - 테마별 데이터 분석 (더미 데이터 포함)"""
-    try:
-        data = request.get_json() if request.get_json() else {}
-        target_date = data.get('date', get_trading_date())
-
-        current_app.logger.info(f"📊 분석 실행 시작: {target_date}")
-
-        # 🔥 항상 더미 데이터 제공 (테스트용)
-        current_app.logger.info(f"더미 데이터 제공: {target_date}")
-
-        dummy_themes = [
-            {
-                'name': 'AI반도체',
-                'icon': '🤖',
-                'change_rate': 4.25,
-                'stock_count': 15,
-                'volume_ratio': 150.3,
-                'positive_stocks': 12,
-                'positive_ratio': 80.0
-            },
-            {
-                'name': '2차전지',
-                'icon': '🔋',
-                'change_rate': 3.18,
-                'stock_count': 8,
-                'volume_ratio': 125.7,
-                'positive_stocks': 6,
-                'positive_ratio': 75.0
-            },
-            {
-                'name': '바이오',
-                'icon': '🧬',
-                'change_rate': 2.85,
-                'stock_count': 12,
-                'volume_ratio': 98.2,
-                'positive_stocks': 8,
-                'positive_ratio': 66.7
-            },
-            {
-                'name': '게임',
-                'icon': '🎮',
-                'change_rate': 1.92,
-                'stock_count': 6,
-                'volume_ratio': 87.4,
-                'positive_stocks': 4,
-                'positive_ratio': 66.7
-            },
-            {
-                'name': '자동차',
-                'icon': '🚗',
-                'change_rate': 0.75,
-                'stock_count': 10,
-                'volume_ratio': 110.8,
-                'positive_stocks': 6,
-                'positive_ratio': 60.0
-            },
-            {
-                'name': '조선',
-                'icon': '🚢',
-                'change_rate': -0.45,
-                'stock_count': 5,
-                'volume_ratio': 92.1,
-                'positive_stocks': 2,
-                'positive_ratio': 40.0
-            },
-            {
-                'name': '화학',
-                'icon': '⚗️',
-                'change_rate': -1.20,
-                'stock_count': 7,
-                'volume_ratio': 78.9,
-                'positive_stocks': 2,
-                'positive_ratio': 28.6
-            }
-        ]
-
-        current_app.logger.info(f"✅ 더미 데이터 분석 완료: {len(dummy_themes)}개 테마")
-
-        return jsonify({
-            'success': True,
-            'message': f'{target_date} 분석 완료 (더미 데이터)',
-            'data': {
-                'themes': dummy_themes,
-                'summary': {
-                    'total_themes': len(dummy_themes),
-                    'analysis_date': target_date,
-                    'positive_themes': len([t for t in dummy_themes if t['change_rate'] > 0])
-                }
-            }
-        })
-
-    except Exception as e:
-        current_app.logger.error(f"분석 실행 실패: {e}")
-        return jsonify({
-            'success': False,
-            'message': f'분석 실행 실패: {str(e)}'
-        }), 500
-
-
-# ============= 🔥 테마 데이터 조회 API (더미 데이터 포함) =============
-
-@top_rate_bp.route('/api/themes')
-def get_themes():
-    """테마별 데이터 조회 (더미 데이터 포함)"""
-    try:
-        date_str = request.args.get('date', get_trading_date())
-
-        # 더미 데이터 제공
-        dummy_themes = [
-            {
-                'name': 'AI반도체',
-                'change_rate': 4.25,
-                'stock_count': 15,
-                'volume_ratio': 150.3,
-                'icon': '🤖'
-            },
-            {
-                'name': '2차전지',
-                'change_rate': 3.18,
-                'stock_count': 8,
-                'volume_ratio': 125.7,
-                'icon': '🔋'
-            },
-            {
-                'name': '바이오',
-                'change_rate': 2.85,
-                'stock_count': 12,
-                'volume_ratio': 98.2,
-                'icon': '🧬'
-            },
-            {
-                'name': '게임',
-                'change_rate': 1.92,
-                'stock_count': 6,
-                'volume_ratio': 87.4,
-                'icon': '🎮'
-            },
-            {
-                'name': '자동차',
-                'change_rate': 0.75,
-                'stock_count': 10,
-                'volume_ratio': 110.8,
-                'icon': '🚗'
-            }
-        ]
-
-        return jsonify({
-            'success': True,
-            'themes': dummy_themes,
-            'date': date_str,
-            'total_count': len(dummy_themes)
-        })
-
-    except Exception as e:
-        current_app.logger.error(f"테마 조회 실패: {e}")
-        return jsonify({
-            'success': False,
-            'message': f'테마 조회 실패: {str(e)}',
-            'themes': []
-        }), 500
-
-
-@top_rate_bp.route('/api/theme-detail')
-def get_theme_detail():
-    """특정 테마 상세정보 조회 (더미 데이터)"""
-    try:
-        date_str = request.args.get('date', get_trading_date())
-        theme_name = request.args.get('theme_name')
-
-        if not theme_name:
-            return jsonify({
-                'success': False,
-                'message': '테마명이 필요합니다.'
-            }), 400
-
-        # 더미 상세 데이터
-        dummy_detail = {
-            'theme_name': theme_name,
-            'date': date_str,
-            'summary': {
-                'total_stocks': 10,
-                'avg_change_rate': 3.5,
-                'positive_stocks': 8,
-                'positive_ratio': 80.0,
-                'total_volume': 50000000
-            },
-            'stocks': [
-                {
-                    'stock_code': '005930',
-                    'stock_name': '삼성전자',
-                    'current_price': 75000,
-                    'change_rate': 2.5,
-                    'volume': 10000000
-                },
-                {
-                    'stock_code': '000660',
-                    'stock_name': 'SK하이닉스',
-                    'current_price': 120000,
-                    'change_rate': 4.2,
-                    'volume': 8000000
-                }
-            ],
-            'news': [
-                {
-                    'title': f'{theme_name} 관련 주요 뉴스',
-                    'summary': '테마 관련 최신 동향',
-                    'date': '2025-08-14'
-                }
-            ]
-        }
-
-        return jsonify({
-            'success': True,
-            'theme_detail': dummy_detail
-        })
-
-    except Exception as e:
-        current_app.logger.error(f"테마 상세정보 조회 실패: {e}")
-        return jsonify({
-            'success': False,
-            'message': f'테마 상세정보 조회 실패: {str(e)}'
-        }), 500
-
-
-# ============= 기존 API 유지 =============
-
-@top_rate_bp.route('/api/available-dates')
-def get_available_dates():
-    """사용 가능한 날짜 목록 조회"""
-    try:
-        # 더미 날짜 데이터
-        dummy_dates = [
-            get_trading_date(),
-            '2025-08-13',
-            '2025-08-12',
-            '2025-08-09'
-        ]
-
-        return jsonify({
-            'success': True,
-            'dates': dummy_dates,
-            'total_count': len(dummy_dates)
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'message': f'날짜 목록 조회 실패: {str(e)}',
-            'dates': []
-        }), 500
-
-
-@top_rate_bp.route('/api/check-date-data')
-def check_date_data():
-    """특정 날짜 데이터 존재 여부 확인 (항상 데이터 있음으로 응답)"""
-    try:
-        date_str = request.args.get('date', get_trading_date())
-
-        if not date_str:
-            return jsonify({
-                'success': False,
-                'message': '날짜가 필요합니다.',
-                'has_data': False
-            }), 400
-
-        current_trading_date = get_trading_date()
-        is_current_date = (date_str == current_trading_date)
-
-        # 🔥 항상 데이터가 있다고 응답 (테스트용)
-        return jsonify({
-            'success': True,
-            'date': date_str,
-            'has_data': True,  # 항상 True
-            'is_current_trading_date': is_current_date,
-            'can_collect': is_current_date,
-            'can_analyze': True,  # 항상 True
-            'status': {
-                'exists': True,
-                'total_stocks': 50,
-                'total_themes': 7,
-                'is_complete': True
-            }
-        })
-
-    except Exception as e:
-        current_app.logger.error(f"날짜 데이터 확인 실패: {e}")
-        return jsonify({
-            'success': False,
-            'message': f'날짜 확인 실패: {str(e)}',
-            'has_data': False
-        }), 500
-
-
-@top_rate_bp.route('/api/collect-data', methods=['POST'])
-def collect_data():
-    """데이터 수집 시작 (더미 진행상황)"""
-    try:
-        data = request.get_json() if request.get_json() else {}
-        target_date = data.get('date', get_trading_date())
-
-        if crawling_progress['is_running']:
-            return jsonify({
-                'success': False,
-                'message': '이미 데이터 수집이 진행 중입니다.'
-            })
-
-        # 더미 크롤링 시뮬레이션
-        def mock_crawling():
-            try:
-                crawling_progress.update({
-                    'is_running': True,
-                    'percent': 0,
-                    'message': '크롤링 시작',
-                    'start_time': datetime.now(),
-                    'success': None,
-                    'error_message': ''
-                })
-
-                import time
-                for i in range(1, 11):
-                    time.sleep(0.3)
-                    crawling_progress.update({
-                        'percent': i * 10,
-                        'message': f'테마 {i}/10 수집 중...'
-                    })
-
-                crawling_progress.update({
-                    'is_running': False,
-                    'percent': 100,
-                    'message': '크롤링 완료',
-                    'end_time': datetime.now(),
-                    'success': True
-                })
-
-            except Exception as e:
-                crawling_progress.update({
-                    'is_running': False,
-                    'success': False,
-                    'error_message': str(e)
-                })
-
-        thread = threading.Thread(target=mock_crawling)
-        thread.daemon = True
-        thread.start()
-
-        return jsonify({
-            'success': True,
-            'message': '데이터 수집을 시작했습니다.',
-            'target_date': target_date
-        })
-
-    except Exception as e:
-        current_app.logger.error(f"데이터 수집 시작 실패: {e}")
-        return jsonify({
-            'success': False,
-            'message': f'데이터 수집 시작 실패: {str(e)}'
-        }), 500
-
-
-@top_rate_bp.route('/api/progress')
-def get_progress():
-    """크롤링 진행상황 조회"""
-    try:
-        progress_data = crawling_progress.copy()
-
-        if progress_data.get('start_time'):
-            progress_data['start_time'] = progress_data['start_time'].isoformat()
-        if progress_data.get('end_time'):
-            progress_data['end_time'] = progress_data['end_time'].isoformat()
-
-        return jsonify(progress_data)
-
-    except Exception as e:
-        current_app.logger.error(f"진행상황 조회 실패: {e}")
-        return jsonify({
-            'is_running': False,
-            'percent': 0,
-            'message': '진행상황 조회 오류',
-            'success': False,
-            'error_message': str(e)
-        })
-
-
-@top_rate_bp.route('/api/test-db')
-def test_database():
-    """데이터베이스 연결 테스트"""
-    try:
-        return jsonify({
-            'success': True,
-            'message': '데이터베이스 연결 테스트 완료 (더미 응답)',
-            'trading_date': get_trading_date()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'message': f'데이터베이스 테스트 실패: {str(e)}'
-        }), 500
-
-
-# ============= 컨텍스트 프로세서 =============
-
-@top_rate_bp.context_processor
-def inject_common_vars():
-    """템플릿에 공통 변수 주입"""
-    return {
-        'module_name': '등락율상위분석',
-        'module_version': '3.1.0',
-        'current_trading_date': get_trading_date(),
-        'api_prefix': '/top-rate/api'
-    }
\ No newline at end of file
@@ -4,60 +4,202 @@
 """
 네이버 금융 접근 테스트
 현재 사이트 구조와 접근 가능 여부 확인
+(개발용 스크립트, aiohttp 필요: pip install -r requirements-dev.txt)
 """
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
 import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List, Optional
 
+import aiohttp
+import lxml.html
+from lxml import etree
 
-def test_naver_finance():
-    """네이버 금융 접근 테스트"""
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Upgrade-Insecure-Requests': '1',
+}
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-        'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-    }
+THEME_URL = "https://finance.naver.com/sise/theme.naver"
+THEME_DETAIL_URL = "https://finance.naver.com/sise/sise_group_detail.naver?type=theme&no=224"  # 2차전지
 
-    print("🔍 네이버 금융 접근 테스트 시작")
-    print("=" * 60)
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# 네이버 금융 페이지는 EUC-KR (meta 태그 감지 없이 고정 지정)
+HTML_PARSER = lxml.html.HTMLParser(encoding='euc-kr')
+
+# 파싱 XPath (모듈 로드 시 한 번만 컴파일, 결과는 lxml 요소 그대로 사용)
+FIND_TYPE1_TABLE = etree.XPath("(//table[contains(concat(' ', normalize-space(@class), ' '), ' type_1 ')])[1]")
+TABLE_ROWS = etree.XPath(".//tr")
+ROW_COLS = etree.XPath(".//td")
+FIRST_LINK = etree.XPath("(.//a)[1]")
+
+# 파싱 결과 디스크 캐시 (테스트 반복 실행 시 이 시간 안에는 요청/파싱 생략)
+CACHE_TTL = int(os.getenv('NAVER_CACHE_TTL', '300'))
+CACHE_DIR = Path(tempfile.gettempdir())
+
+# 동시 요청 수 제한 (네이버 IP별 요청 제한에 걸리지 않도록, 호스트당 연결 수와 동일)
+MAX_CONCURRENCY = int(os.getenv('NAVER_CONCURRENCY', '8'))
+REQUEST_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENCY)
+
+# 429(요청 제한) 응답 재시도 (대기: 0.5초, 1초, 2초)
+MAX_RETRIES = 3
+RETRY_BACKOFF_BASE = 0.5
+
+
+async def fetch(session: aiohttp.ClientSession, url: str):
+    """페이지 요청 (응답 코드, 본문 bytes 반환, 429는 지수 백오프로 재시도)"""
+    async with REQUEST_SEMAPHORE:
+        for attempt in range(MAX_RETRIES + 1):
+            async with session.get(url) as response:
+                if response.status != 429 or attempt == MAX_RETRIES:
+                    return response.status, await response.read()
+
+            delay = RETRY_BACKOFF_BASE * 2 ** attempt
+            print(f"⏳ 요청 제한(429) - {delay:.1f}초 후 재시도 ({attempt + 1}/{MAX_RETRIES}): {url}")
+            await asyncio.sleep(delay)
+
+
+@dataclass(slots=True)
+class ThemeRow:
+    """테마 목록 행"""
+    name: str
+    change_rate: str
+
+
+@dataclass(slots=True)
+class StockRow:
+    """테마 상세 종목 행"""
+    name: str
+    price: str
+    change: str
 
-    # 1단계: 메인 테마 페이지 접근
-    theme_url = "https://finance.naver.com/sise/theme.naver"
 
+def _cache_path(url: str) -> Path:
+    """URL별 캐시 파일 경로"""
+    return CACHE_DIR / f"naver_{hashlib.md5(url.encode()).hexdigest()}.json"
+
+
+def load_cached_rows(url: str, row_type):
+    """TTL 안의 파싱 결과 (없거나 만료/손상 시 None, 캐시 삭제로 무효화)"""
     try:
-        print(f"📡 테마 페이지 접근: {theme_url}")
-        response = requests.get(theme_url, headers=headers, timeout=10)
-        print(f"📊 응답 코드: {response.status_code}")
-        print(f"📏 응답 크기: {len(response.text):,} bytes")
-
-        if response.status_code == 200:
-            response.encoding = 'euc-kr'
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # 테이블 찾기
-            table = soup.find('table', {'class': 'type_1'})
-            if table:
-                rows = table.find_all('tr')[1:]  # 헤더 제외
-                print(f"✅ 테마 테이블 발견: {len(rows)}개 행")
-
-                # 처음 5개 테마 정보 출력
-                print("\n📋 상위 5개 테마:")
-                for i, row in enumerate(rows[:5]):
-                    try:
-                        cols = row.find_all('td')
-                        if len(cols) >= 4:
-                            theme_link = cols[0].find('a')
-                            if theme_link:
-                                theme_name = theme_link.text.strip()
-                                change_rate = cols[3].text.strip()
-                                print(f"   {i + 1}. {theme_name} ({change_rate})")
-                    except Exception as e:
-                        print(f"   {i + 1}. 파싱 오류: {e}")
+        with open(_cache_path(url), encoding='utf-8') as f:
+            cached = json.load(f)
+        if time.time() - cached['saved_at'] >= CACHE_TTL:
+            return None
+        return [row_type(**row) for row in cached['rows']]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_cached_rows(url: str, rows) -> None:
+    """파싱 결과 저장 (실패해도 테스트는 계속)"""
+    try:
+        with open(_cache_path(url), 'w', encoding='utf-8') as f:
+            json.dump({'saved_at': time.time(), 'rows': [asdict(row) for row in rows]}, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"⚠️ 캐시 저장 실패: {e}")
+
+
+def parse_theme_rows(body: bytes) -> Optional[List[ThemeRow]]:
+    """테마 목록 파싱 (테마 테이블이 없으면 None)"""
+    # 본문을 str로 먼저 디코딩하지 않고 bytes 그대로 lxml에 전달 (EUC-KR 디코딩도 C 파서에서 처리)
+    doc = lxml.html.document_fromstring(body, parser=HTML_PARSER)
+
+    tables = FIND_TYPE1_TABLE(doc)
+    if not tables:
+        return None
+
+    themes = []
+    for i, row in enumerate(TABLE_ROWS(tables[0])[1:]):  # 헤더 제외
+        try:
+            cols = ROW_COLS(row)
+            if len(cols) >= 4:
+                theme_links = FIRST_LINK(cols[0])
+                if theme_links:
+                    themes.append(ThemeRow(
+                        name=theme_links[0].text_content().strip(),
+                        change_rate=cols[3].text_content().strip()
+                    ))
+        except Exception as e:
+            print(f"   {i + 1}번째 행 파싱 오류: {e}")
+    return themes
+
+
+def parse_stock_rows(body: bytes) -> Optional[List[StockRow]]:
+    """테마 상세 종목 파싱 (종목 테이블이 없으면 None)"""
+    doc = lxml.html.document_fromstring(body, parser=HTML_PARSER)
+
+    tables = FIND_TYPE1_TABLE(doc)
+    if not tables:
+        return None
+
+    stocks = []
+    for i, row in enumerate(TABLE_ROWS(tables[0])[1:]):  # 헤더 제외
+        try:
+            cols = ROW_COLS(row)
+            if len(cols) >= 6:
+                stock_links = FIRST_LINK(cols[0])
+                if stock_links:
+                    stocks.append(StockRow(
+                        name=stock_links[0].text_content().strip(),
+                        price=cols[1].text_content().strip(),
+                        change=cols[3].text_content().strip()
+                    ))
+        except Exception as e:
+            print(f"   {i + 1}번째 행 파싱 오류: {e}")
+    return stocks
+
+
+def print_theme_rows(themes: List[ThemeRow]):
+    """테마 목록 출력 (상위 5개)"""
+    print(f"✅ 테마 테이블 발견: {len(themes)}개 테마")
+
+    print("\n📋 상위 5개 테마:")
+    for i, theme in enumerate(themes[:5]):
+        print(f"   {i + 1}. {theme.name} ({theme.change_rate})")
+
+
+def print_stock_rows(stocks: List[StockRow]):
+    """종목 목록 출력 (상위 3개)"""
+    print(f"✅ 종목 테이블 발견: {len(stocks)}개 종목")
+
+    print("\n📈 상위 3개 종목:")
+    for i, stock in enumerate(stocks[:3]):
+        print(f"   {i + 1}. {stock.name} ({stock.price}, {stock.change})")
+
+
+def print_theme_page(result, cached: Optional[List[ThemeRow]] = None):
+    """1단계: 메인 테마 페이지 결과 출력"""
+    print(f"📡 테마 페이지 접근: {THEME_URL}")
+
+    if cached is not None:
+        print("💾 캐시된 파싱 결과 사용 (요청 생략)")
+        print_theme_rows(cached)
+        return
+
+    try:
+        if isinstance(result, BaseException):
+            raise result
+
+        status, body = result
+        print(f"📊 응답 코드: {status}")
+        print(f"📏 응답 크기: {len(body):,} bytes")
+
+        if status == 200:
+            themes = parse_theme_rows(body)
+            if themes is not None:
+                save_cached_rows(THEME_URL, themes)
+                print_theme_rows(themes)
 
             else:
                 print("❌ 테마 테이블을 찾을 수 없습니다")
@@ -65,65 +207,78 @@ def test_naver_finance():
 
                 # 페이지 내용 샘플 출력
                 print("\n📄 페이지 내용 샘플 (처음 500자):")
-                print(response.text[:500])
+                print(body[:1000].decode('euc-kr', errors='replace')[:500])
 
         else:
-            print(f"❌ 접근 실패: HTTP {response.status_code}")
+            print(f"❌ 접근 실패: HTTP {status}")
 
-    except requests.exceptions.Timeout:
+    except asyncio.TimeoutError:
         print("❌ 타임아웃 발생")
-    except requests.exceptions.ConnectionError:
+    except aiohttp.ClientConnectionError:
         print("❌ 연결 오류")
     except Exception as e:
         print(f"❌ 기타 오류: {e}")
 
-    print("\n" + "=" * 60)
 
-    # 2단계: 특정 테마 상세 페이지 테스트
-    theme_detail_url = "https://finance.naver.com/sise/sise_group_detail.naver?type=theme&no=224"  # 2차전지
+def print_theme_detail_page(result, cached: Optional[List[StockRow]] = None):
+    """2단계: 특정 테마 상세 페이지 결과 출력"""
+    print(f"📡 테마 상세 페이지 접근: {THEME_DETAIL_URL}")
+
+    if cached is not None:
+        print("💾 캐시된 파싱 결과 사용 (요청 생략)")
+        print_stock_rows(cached)
+        return
 
     try:
-        print(f"📡 테마 상세 페이지 접근: {theme_detail_url}")
-        response = requests.get(theme_detail_url, headers=headers, timeout=10)
-        print(f"📊 응답 코드: {response.status_code}")
-
-        if response.status_code == 200:
-            response.encoding = 'euc-kr'
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # 종목 테이블 찾기
-            table = soup.find('table', {'class': 'type_1'})
-            if table:
-                rows = table.find_all('tr')[1:]  # 헤더 제외
-                print(f"✅ 종목 테이블 발견: {len(rows)}개 행")
-
-                # 처음 3개 종목 정보 출력
-                print("\n📈 상위 3개 종목:")
-                for i, row in enumerate(rows[:3]):
-                    try:
-                        cols = row.find_all('td')
-                        if len(cols) >= 6:
-                            stock_link = cols[0].find('a')
-                            if stock_link:
-                                stock_name = stock_link.text.strip()
-                                price = cols[1].text.strip()
-                                change = cols[3].text.strip()
-                                print(f"   {i + 1}. {stock_name} ({price}, {change})")
-                    except Exception as e:
-                        print(f"   {i + 1}. 파싱 오류: {e}")
+        if isinstance(result, BaseException):
+            raise result
+
+        status, body = result
+        print(f"📊 응답 코드: {status}")
+
+        if status == 200:
+            stocks = parse_stock_rows(body)
+            if stocks is not None:
+                save_cached_rows(THEME_DETAIL_URL, stocks)
+                print_stock_rows(stocks)
 
             else:
                 print("❌ 종목 테이블을 찾을 수 없습니다")
 
         else:
-            print(f"❌ 접근 실패: HTTP {response.status_code}")
+            print(f"❌ 접근 실패: HTTP {status}")
 
     except Exception as e:
         print(f"❌ 오류: {e}")
 
+
+async def test_naver_finance():
+    """네이버 금융 접근 테스트 (캐시에 없는 페이지만 동시에 요청)"""
+
+    print("🔍 네이버 금융 접근 테스트 시작")
+    print("=" * 60)
+
+    cached_themes = load_cached_rows(THEME_URL, ThemeRow)
+    cached_stocks = load_cached_rows(THEME_DETAIL_URL, StockRow)
+    urls = [url for url, cached in ((THEME_URL, cached_themes), (THEME_DETAIL_URL, cached_stocks)) if cached is None]
+
+    results = {}
+    if urls:
+        connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENCY)
+        async with aiohttp.ClientSession(headers=HEADERS, timeout=REQUEST_TIMEOUT, connector=connector) as session:
+            # 두 페이지는 서로 독립이므로 동시에 요청 (실패는 단계별로 출력)
+            fetched = await asyncio.gather(*(fetch(session, url) for url in urls), return_exceptions=True)
+        results = dict(zip(urls, fetched))
+
+    print_theme_page(results.get(THEME_URL), cached_themes)
+
+    print("\n" + "=" * 60)
+
+    print_theme_detail_page(results.get(THEME_DETAIL_URL), cached_stocks)
+
     print("\n" + "=" * 60)
     print("🎯 테스트 완료")
 
 
 if __name__ == "__main__":
-    test_naver_finance()
\ No newline at end of file
+    asyncio.run(test_naver_finance())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+숫자/퍼센트 파싱 경계값 확인 스크립트
+- float() 빠른 경로가 nan, inf, 지수 표기를 받아들이지 않고 정규식 경로와 같은 결과를 내는지 확인
+- 대상: common.utils.parse_number / parse_percentage, TopRateCrawler._parse_percentage
+"""
+
+import math
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.utils import parse_number, parse_percentage
+from modules.top_rate_analysis.crawler import TopRateCrawler
+
+# (입력, parse_number 기대값, parse_percentage 기대값)
+COMMON_CASES = [
+    ('1,234', 1234.0, 1.0),
+    ('+3.45%', 3.45, 3.45),
+    ('-2.10%', -2.1, -2.1),
+    ('.5', 0.5, 0.5),
+    ('3.', 3.0, 3.0),
+    ('  7  ', 7.0, 7.0),
+    ('nan', None, None),
+    ('inf', None, None),
+    ('-Infinity', None, None),
+    ('1e5', 15.0, 1.0),
+    ('+', None, None),
+    ('abc', None, None),
+    ('', None, None),
+    (None, None, None),
+]
+
+# (입력, 크롤러 _parse_percentage 기대값) - 파싱 불가 시 0
+CRAWLER_CASES = [
+    ('+3.45%', 3.45),
+    ('-29.98%', -29.98),
+    ('상한가 +30.00%', 30.0),
+    ('nan', 0),
+    ('inf%', 0),
+    ('1e5', 1.0),
+    ('', 0),
+    (None, 0),
+]
+
+failures = []
+
+
+def check(label, actual, expected):
+    """기대값 비교 (nan/inf가 섞여 나오면 실패로 처리)"""
+    ok = actual == expected and (actual is None or math.isfinite(actual))
+    print(f"   {'✅' if ok else '❌'} {label}: {actual!r} (기대값 {expected!r})")
+    if not ok:
+        failures.append(label)
+
+
+def main():
+    """메인 실행"""
+    print("🚀 숫자/퍼센트 파싱 경계값 확인")
+
+    print("\n" + "=" * 60)
+    print("🔢 common.utils")
+    print("=" * 60)
+    for text, number, percentage in COMMON_CASES:
+        check(f"parse_number({text!r})", parse_number(text), number)
+        check(f"parse_percentage({text!r})", parse_percentage(text), percentage)
+
+    print("\n" + "=" * 60)
+    print("🕷️ TopRateCrawler._parse_percentage")
+    print("=" * 60)
+    # 파싱 메서드는 인스턴스 상태를 쓰지 않으므로 세션 생성 없이 호출
+    crawler = TopRateCrawler.__new__(TopRateCrawler)
+    for text, expected in CRAWLER_CASES:
+        check(f"_parse_percentage({text!r})", crawler._parse_percentage(text), expected)
+
+    print("\n" + "=" * 60)
+    if failures:
+        print(f"❌ 실패 {len(failures)}건")
+        sys.exit(1)
+
+    print("🎯 모든 확인 통과")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+등락율상위분석 API 동작 확인 스크립트
+- 데이터 수집 요청 중복 처리 (같은 날짜는 진행상황 반환, 다른 크롤링 실행 중이면 409)
+- 분석 결과 스트리밍 (도중에 조회가 실패해도 올바른 JSON으로 실패 응답)
+- 일괄 조회 (형식이 잘못된 요청은 해당 결과만 실패)
+- 개발용 강제 크롤링 (잠금 미획득 시 409, 성공 시 날짜 캐시 무효화)
+Flask 테스트 클라이언트로 실행 (실제 크롤링/DB 조회 없음)
+"""
+
+import os
+import sys
+from concurrent.futures import Future
+from contextlib import contextmanager
+from unittest import mock
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+
+from common.json_provider import OrjsonProvider
+from modules.top_rate_analysis import routes
+from modules.top_rate_analysis.database import ThemeResult
+
+failures = []
+
+
+def check(label, condition):
+    """확인 결과 출력 (실패는 모아서 마지막에 종료 코드로 반환)"""
+    print(f"   {'✅' if condition else '❌'} {label}")
+    if not condition:
+        failures.append(label)
+
+
+def create_test_app():
+    """등락율상위분석 블루프린트만 등록한 테스트 앱"""
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    app.register_blueprint(routes.top_rate_bp, url_prefix='/top-rate')
+    app.register_blueprint(routes.top_rate_dev_bp, url_prefix='/top-rate')
+    return app
+
+
+def test_collect_data_conflicts(client):
+    """크롤링 실행 중 수집 요청 처리 확인"""
+    print("\n" + "=" * 60)
+    print("🚦 데이터 수집 중복 요청")
+    print("=" * 60)
+
+    # 완료되지 않는 Future로 '2000-01-01' 크롤링이 실행 중인 상태를 만듦
+    running = Future()
+    with mock.patch.dict(routes._crawl_futures, {'2000-01-01': running}):
+        response = client.post('/top-rate/api/collect-data', json={'date': '2000-01-01'})
+        data = response.get_json()
+        check("같은 날짜: 200 응답", response.status_code == 200)
+        check("같은 날짜: already_running 표시", data.get('success') is True and data.get('already_running') is True)
+        check("같은 날짜: 대상 날짜 포함", data.get('target_date') == '2000-01-01')
+        check("같은 날짜: 진행상황 포함", isinstance(data.get('progress'), dict) and 'is_running' in data['progress'])
+
+        response = client.post('/top-rate/api/collect-data', json={'date': '2000-01-02'})
+        data = response.get_json()
+        check("다른 날짜: 409 응답", response.status_code == 409)
+        check("다른 날짜: 실패 메시지", data.get('success') is False and bool(data.get('message')))
+
+    # 실행 중인 작업은 없지만 진행상황이 실행 중으로 남아 있는 경우 (다른 경로로 시작된 크롤링)
+    with mock.patch.object(routes, 'crawling_progress', routes.CrawlProgress(is_running=True)), \
+            mock.patch.object(routes, '_submit_crawl') as submit_crawl:
+        response = client.post('/top-rate/api/collect-data', json={'date': '2000-01-03'})
+        check("진행상황 실행 중: 409 응답", response.status_code == 409)
+        check("진행상황 실행 중: 새 크롤링 미제출", submit_crawl.call_count == 0)
+
+
+def _theme_result(rank, strength='NORMAL'):
+    """분석 결과 행 샘플"""
+    return ThemeResult(
+        rank=rank, theme_name=f'테마{rank}', icon='📈', stock_count=5, avg_change_rate=3.5,
+        positive_stocks=4, positive_ratio=80.0, total_volume=1000, avg_news_count=2.0,
+        strength=strength, date='2000-01-01'
+    )
+
+
+def test_analyze_stream(client):
+    """분석 결과 스트리밍 응답 확인"""
+    print("\n" + "=" * 60)
+    print("📊 분석 결과 스트리밍")
+    print("=" * 60)
+
+    def complete_rows(date_str, check_exists=True):
+        yield _theme_result(1, 'HOT')
+        yield _theme_result(2)
+
+    def failing_rows(date_str, check_exists=True):
+        yield _theme_result(1)
+        raise RuntimeError('커서 끊김')
+
+    with mock.patch.object(routes, '_has_data', return_value=True), \
+            mock.patch.object(routes.db, 'iter_theme_analysis_results', side_effect=complete_rows) as iter_rows:
+        response = client.post('/top-rate/api/analyze', json={'date': '2000-01-01'})
+        data = response.get_json()
+        check("정상: success true", data.get('success') is True)
+        check("정상: 테마 2개와 요약 포함",
+              len(data.get('themes', [])) == 2 and data.get('summary', {}).get('hot_themes') == 1)
+        check("정상: 라우트에서 확인했으므로 존재 확인 생략",
+              iter_rows.call_args.kwargs.get('check_exists') is False)
+
+    routes._invalidate_date_caches()
+
+    with mock.patch.object(routes, '_has_data', return_value=True), \
+            mock.patch.object(routes.db, 'iter_theme_analysis_results', side_effect=failing_rows):
+        response = client.post('/top-rate/api/analyze', json={'date': '2000-01-01'})
+        data = response.get_json()
+        check("도중 실패: JSON 파싱 가능", data is not None)
+        check("도중 실패: success false", data is not None and data.get('success') is False)
+        check("도중 실패: 오류 메시지 포함", data is not None and '커서 끊김' in data.get('message', ''))
+        check("도중 실패: 응답 캐시에 저장 안 함", '2000-01-01' not in routes._past_analysis_bodies)
+
+    routes._invalidate_date_caches()
+
+
+def test_batch_invalid_ops(client):
+    """일괄 조회에서 잘못된 요청이 전체 실패로 번지지 않는지 확인"""
+    print("\n" + "=" * 60)
+    print("📦 일괄 조회 잘못된 요청")
+    print("=" * 60)
+
+    ops = [
+        {'op': 'check_date', 'date': '2000-01-01'},
+        {'op': 'check_date', 'date': 20000101},
+        {'op': 'check_date', 'date': ['2000-01-01']},
+        {'op': 'check_date', 'date': '2000-01-01; DROP TABLE x'},
+        {'op': 'theme_detail', 'date': '2000-01-01', 'theme': ['2차전지']},
+        {'op': 'theme_detail', 'date': '2000-01-01', 'theme': {'name': '2차전지'}},
+        {'op': 'theme_detail', 'date': '2000-01-01', 'theme': '2차전지'},
+    ]
+
+    with mock.patch.object(routes, '_has_data', return_value=True) as has_data, \
+            mock.patch.object(routes, '_cached_theme_details',
+                              return_value={'2차전지': {'theme_name': '2차전지'}}) as theme_details:
+        response = client.post('/top-rate/api/batch', json={'ops': ops})
+        data = response.get_json()
+        results = data.get('results', [])
+
+        check("전체 응답 200", response.status_code == 200 and data.get('success') is True)
+        check("요청 수만큼 결과", len(results) == len(ops))
+        check("정상 날짜 확인 성공", results[0].get('success') is True)
+        check("잘못된 날짜 3건은 해당 결과만 실패", all(result.get('success') is False for result in results[1:4]))
+        check("문자열이 아닌 테마 2건은 해당 결과만 실패", all(result.get('success') is False for result in results[4:6]))
+        check("정상 테마 조회 성공", results[6].get('success') is True)
+        check("잘못된 날짜는 DB 조회 안 함", [call.args[0] for call in has_data.call_args_list] == ['2000-01-01'])
+        check("테마 조회는 정상 테마만", theme_details.call_args.args[0] == ['2차전지'])
+
+
+def _fake_crawl_lock(acquired):
+    """crawl_lock 획득 결과만 흉내내는 잠금"""
+    @contextmanager
+    def crawl_lock(timeout=0):
+        yield acquired
+    return crawl_lock
+
+
+def test_dev_force_crawl(client):
+    """개발용 강제 크롤링 응답과 캐시 무효화 확인"""
+    print("\n" + "=" * 60)
+    print("🛠️ 개발용 강제 크롤링")
+    print("=" * 60)
+
+    crawler = mock.Mock()
+    crawler.return_value.crawl_and_save.return_value = True
+
+    with mock.patch.object(routes.db, 'crawl_lock', _fake_crawl_lock(False)), \
+            mock.patch.object(routes, 'TopRateCrawler', crawler), \
+            mock.patch.object(routes, '_invalidate_date_caches') as invalidate:
+        response = client.get('/top-rate/api/dev/force-crawl/2000-01-01')
+        data = response.get_json()
+        check("잠금 미획득: 409 응답", response.status_code == 409)
+        check("잠금 미획득: 수집 요청과 같은 메시지", data.get('message') == '이미 크롤링이 실행 중입니다.')
+        check("잠금 미획득: 크롤러 미실행", crawler.return_value.crawl_and_save.call_count == 0)
+        check("잠금 미획득: 캐시 유지", invalidate.call_count == 0)
+
+    with mock.patch.object(routes.db, 'crawl_lock', _fake_crawl_lock(True)), \
+            mock.patch.object(routes, 'TopRateCrawler', crawler), \
+            mock.patch.object(routes, '_invalidate_date_caches') as invalidate:
+        response = client.get('/top-rate/api/dev/force-crawl/2000-01-01')
+        data = response.get_json()
+        check("성공: 200 응답", response.status_code == 200 and data.get('success') is True)
+        check("성공: 날짜 캐시 무효화", invalidate.call_count == 1)
+
+    crawler.return_value.crawl_and_save.return_value = False
+    with mock.patch.object(routes.db, 'crawl_lock', _fake_crawl_lock(True)), \
+            mock.patch.object(routes, 'TopRateCrawler', crawler), \
+            mock.patch.object(routes, '_invalidate_date_caches') as invalidate:
+        response = client.get('/top-rate/api/dev/force-crawl/2000-01-01')
+        data = response.get_json()
+        check("실패: success false", data.get('success') is False)
+        check("실패: 캐시 유지", invalidate.call_count == 0)
+
+
+def main():
+    """메인 실행"""
+    print("🚀 등락율상위분석 API 동작 확인")
+
+    app = create_test_app()
+    with app.test_client() as client:
+        test_collect_data_conflicts(client)
+        test_analyze_stream(client)
+        test_batch_invalid_ops(client)
+        test_dev_force_crawl(client)
+
+    print("\n" + "=" * 60)
+    if failures:
+        print(f"❌ 실패 {len(failures)}건")
+        for label in failures:
+            print(f"   - {label}")
+        sys.exit(1)
+
+    print("🎯 모든 확인 통과")
+
+
+if __name__ == "__main__":
+    main()
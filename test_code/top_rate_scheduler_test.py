@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+등락율상위분석 스케줄러 동작 확인 스크립트
+- 스케줄 설정 재적용 시 잡스토어 변경 없음 (멱등성)
+- 설정 변경 시 바뀐 스케줄만 제거/추가
+- 휴일/장외시간, 크롤링 잠금 미획득 시 크롤러 미실행
+DB/네트워크 없이 실행 (크롤러/DB는 가짜 객체로 대체)
+"""
+
+import asyncio
+import os
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+from unittest import mock
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.top_rate_analysis import scheduler as scheduler_module
+from modules.top_rate_analysis.scheduler import TopRateScheduler
+
+failures = []
+
+
+def check(label, condition):
+    """확인 결과 출력 (실패는 모아서 마지막에 종료 코드로 반환)"""
+    print(f"   {'✅' if condition else '❌'} {label}")
+    if not condition:
+        failures.append(label)
+
+
+def make_paused_scheduler():
+    """작업이 실제로 실행되지 않도록 일시정지 상태로 시작한 스케줄러"""
+    sched = TopRateScheduler()
+    sched._ensure_loop_thread()
+    sched.scheduler.start(paused=True)
+    sched.is_running = True
+    return sched
+
+
+def job_ids(sched):
+    """스케줄러에 등록된 작업 ID 집합"""
+    return {job.id for job in sched.scheduler.get_jobs()}
+
+
+def test_add_before_start():
+    """시작 전 등록한 스케줄도 active_schedules에 반영되는지 확인"""
+    print("\n" + "=" * 60)
+    print("🕘 시작 전 스케줄 등록")
+    print("=" * 60)
+
+    sched = TopRateScheduler()
+    job_id = sched.add_schedule(hour=9, minute=15, name='장시작후')
+
+    check("작업 ID 반환", job_id == 'auto_crawling_09_15')
+    check("active_schedules에 등록", job_id in sched.active_schedules)
+    check("대기 작업 next_run은 None", sched.active_schedules[job_id].next_run is None)
+
+
+def test_reconcile_idempotent():
+    """같은 설정을 다시 적용하면 잡스토어를 건드리지 않는지 확인"""
+    print("\n" + "=" * 60)
+    print("🔁 스케줄 설정 재적용 (멱등성)")
+    print("=" * 60)
+
+    sched = make_paused_scheduler()
+    config = [
+        {'hour': 9, 'minute': 15, 'enabled': True, 'name': '장시작후'},
+        {'hour': 14, 'minute': 0, 'enabled': True, 'name': '오후2시'},
+        {'hour': 17, 'minute': 30, 'enabled': False, 'name': '장마감후'}
+    ]
+
+    try:
+        check("첫 적용 성공", sched.update_schedule_config(config))
+        first_ids = job_ids(sched)
+        check("활성 스케줄 2개 등록", first_ids == {'auto_crawling_09_15', 'auto_crawling_14_00'})
+
+        with mock.patch.object(sched.scheduler, 'add_job', wraps=sched.scheduler.add_job) as add_job, \
+                mock.patch.object(sched.scheduler, 'remove_job', wraps=sched.scheduler.remove_job) as remove_job:
+            check("재적용 성공", sched.update_schedule_config(config))
+            check("재적용 시 add_job 호출 없음", add_job.call_count == 0)
+            check("재적용 시 remove_job 호출 없음", remove_job.call_count == 0)
+
+        check("작업 목록 그대로", job_ids(sched) == first_ids)
+        check("active_schedules 시간순 유지",
+              list(sched.active_schedules) == ['auto_crawling_09_15', 'auto_crawling_14_00'])
+
+    finally:
+        sched.stop()
+
+
+def test_reconcile_diff():
+    """설정 변경 시 빠진 스케줄만 제거하고 새 스케줄만 추가하는지 확인"""
+    print("\n" + "=" * 60)
+    print("🔀 스케줄 설정 변경 (제거/추가 차이만 반영)")
+    print("=" * 60)
+
+    sched = make_paused_scheduler()
+
+    try:
+        sched.update_schedule_config([
+            {'hour': 9, 'minute': 15, 'enabled': True, 'name': '장시작후'},
+            {'hour': 14, 'minute': 0, 'enabled': True, 'name': '오후2시'},
+            {'hour': 17, 'minute': 30, 'enabled': False, 'name': '장마감후'}
+        ])
+
+        with mock.patch.object(sched.scheduler, 'add_job', wraps=sched.scheduler.add_job) as add_job, \
+                mock.patch.object(sched.scheduler, 'remove_job', wraps=sched.scheduler.remove_job) as remove_job:
+            sched.update_schedule_config([
+                {'hour': 9, 'minute': 15, 'enabled': True, 'name': '장시작후'},
+                {'hour': 14, 'minute': 0, 'enabled': False, 'name': '오후2시'},
+                {'hour': 17, 'minute': 30, 'enabled': True, 'name': '장마감후'}
+            ])
+
+            removed = [call.args[0] for call in remove_job.call_args_list]
+            added = [call.kwargs['id'] for call in add_job.call_args_list]
+
+        check("14:00만 제거", removed == ['auto_crawling_14_00'])
+        check("17:30만 추가", added == ['auto_crawling_17_30'])
+        check("최종 작업 목록", job_ids(sched) == {'auto_crawling_09_15', 'auto_crawling_17_30'})
+        check("active_schedules 시간순 유지",
+              list(sched.active_schedules) == ['auto_crawling_09_15', 'auto_crawling_17_30'])
+
+        # 같은 시각의 이름만 바뀌면 그 작업만 교체
+        with mock.patch.object(sched.scheduler, 'add_job', wraps=sched.scheduler.add_job) as add_job:
+            sched.update_schedule_config([
+                {'hour': 9, 'minute': 15, 'enabled': True, 'name': '개장'},
+                {'hour': 17, 'minute': 30, 'enabled': True, 'name': '장마감후'}
+            ])
+            added = [call.kwargs['id'] for call in add_job.call_args_list]
+
+        check("이름 변경 시 해당 작업만 교체", added == ['auto_crawling_09_15'])
+        check("변경된 이름 반영", sched.active_schedules['auto_crawling_09_15'].name == '개장')
+
+    finally:
+        sched.stop()
+
+
+class FakeDatabase:
+    """crawl_lock 획득 결과만 흉내내는 DB"""
+
+    acquired = False
+
+    @contextmanager
+    def crawl_lock(self, timeout: int = 0):
+        yield self.acquired
+
+
+def test_crawl_skip_paths():
+    """휴일/장외시간, 잠금 미획득 시 크롤러를 실행하지 않는지 확인"""
+    print("\n" + "=" * 60)
+    print("⏭️ 자동 크롤링 건너뛰기 경로")
+    print("=" * 60)
+
+    sched = TopRateScheduler()
+
+    # 휴일/장외시간: 쓰레드 풀로 넘기기 전에 종료
+    with mock.patch.object(sched, 'should_skip_crawling', return_value=(True, '휴일/주말')), \
+            mock.patch.object(sched, '_run_scheduled_crawling') as run_crawling:
+        asyncio.run(sched._scheduled_crawling('테스트'))
+        check("휴일이면 크롤링 본체 미호출", run_crawling.call_count == 0)
+
+    with mock.patch.object(sched, 'should_skip_crawling', return_value=(False, '')), \
+            mock.patch.object(sched, '_run_scheduled_crawling') as run_crawling:
+        asyncio.run(sched._scheduled_crawling('테스트'))
+        check("평일이면 크롤링 본체 1회 호출", run_crawling.call_count == 1)
+
+    # 다른 프로세스가 잠금을 잡고 있으면 크롤러 미실행
+    sched._crawler = mock.Mock()
+    with mock.patch.object(scheduler_module, 'TopRateDatabase', FakeDatabase), \
+            mock.patch.object(FakeDatabase, 'acquired', False):
+        sched._run_scheduled_crawling('테스트')
+    check("잠금 미획득 시 crawl_and_save 미호출", sched._crawler.crawl_and_save.call_count == 0)
+
+    with mock.patch.object(scheduler_module, 'TopRateDatabase', FakeDatabase), \
+            mock.patch.object(FakeDatabase, 'acquired', True):
+        sched._run_scheduled_crawling('테스트')
+    check("잠금 획득 시 crawl_and_save 1회 호출", sched._crawler.crawl_and_save.call_count == 1)
+
+
+def test_holiday_or_weekend():
+    """주말/공휴일 판정 확인"""
+    print("\n" + "=" * 60)
+    print("📅 휴일/주말 판정")
+    print("=" * 60)
+
+    sched = TopRateScheduler()
+
+    check("토요일은 휴일", sched.is_holiday_or_weekend(datetime(2025, 10, 11, 10, 0)))
+    check("평일은 거래일", not sched.is_holiday_or_weekend(datetime(2025, 10, 14, 10, 0)))
+
+    if scheduler_module.holidays is not None:
+        check("개천절(평일)은 휴일", sched.is_holiday_or_weekend(datetime(2025, 10, 3, 10, 0)))
+    else:
+        print("   ℹ️ holidays 미설치 - 공휴일 판정 생략")
+
+
+def main():
+    """메인 실행"""
+    print("🚀 등락율상위분석 스케줄러 동작 확인")
+
+    test_add_before_start()
+    test_reconcile_idempotent()
+    test_reconcile_diff()
+    test_crawl_skip_paths()
+    test_holiday_or_weekend()
+
+    print("\n" + "=" * 60)
+    if failures:
+        print(f"❌ 실패 {len(failures)}건")
+        for label in failures:
+            print(f"   - {label}")
+        sys.exit(1)
+
+    print("🎯 모든 확인 통과")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+등락율상위분석 테마 강도 분류 일치 확인 스크립트
+- 테마 카드의 _calculate_theme_strength와 요약 통계 SQL의 CASE 분류식이 같은 등급을 내는지 확인
+- CASE 식은 MySQL 대신 메모리 SQLite에서 평가 (실수 컬럼으로 MySQL 소수 나눗셈과 맞춤)
+"""
+
+import os
+import sqlite3
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.top_rate_analysis.database import TopRateDatabase, _STRENGTH_CASE_SQL
+
+# 기준값 경계 주변을 모두 포함하는 평균 등락율 샘플
+CHANGE_RATE_SAMPLES = (-3.0, 0.0, 0.99, 1.0, 1.01, 2.99, 3.0, 3.01, 4.99, 5.0, 5.01, 12.5)
+MAX_STOCK_COUNT = 30
+
+
+def main():
+    """메인 실행"""
+    print("🚀 테마 강도 분류 일치 확인")
+    print("=" * 60)
+    print(f"📐 SQL 분류식: {_STRENGTH_CASE_SQL}")
+
+    db = TopRateDatabase()
+
+    connection = sqlite3.connect(':memory:')
+    connection.execute("CREATE TABLE theme_stats (avg_change_rate REAL, positive_stocks REAL, stock_count REAL)")
+    connection.executemany(
+        "INSERT INTO theme_stats VALUES (?, ?, ?)",
+        [
+            (change_rate, positive_stocks, stock_count)
+            for change_rate in CHANGE_RATE_SAMPLES
+            for stock_count in range(3, MAX_STOCK_COUNT + 1)  # 테마 통계는 3개 종목 이상
+            for positive_stocks in range(stock_count + 1)
+        ]
+    )
+
+    rows = connection.execute(
+        f"SELECT avg_change_rate, positive_stocks, stock_count, {_STRENGTH_CASE_SQL} FROM theme_stats"
+    ).fetchall()
+
+    mismatches = []
+    for change_rate, positive_stocks, stock_count, sql_strength in rows:
+        # iter_theme_analysis_results와 같은 방식으로 상승 비율 계산
+        positive_ratio = positive_stocks / stock_count * 100
+        strength = db._calculate_theme_strength(change_rate, positive_ratio, int(stock_count))
+        if strength != sql_strength:
+            mismatches.append((change_rate, int(positive_stocks), int(stock_count), strength, sql_strength))
+
+    print(f"📊 비교한 조합: {len(rows):,}개")
+
+    if mismatches:
+        print(f"❌ 불일치 {len(mismatches)}건 (등락율, 상승종목, 종목수, 파이썬, SQL)")
+        for mismatch in mismatches[:10]:
+            print(f"   {mismatch}")
+        sys.exit(1)
+
+    grades = sorted({row[3] for row in rows})
+    print(f"✅ 모든 조합 일치 (등장한 등급: {', '.join(grades)})")
+
+
+if __name__ == "__main__":
+    main()
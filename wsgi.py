@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+운영 서버용 WSGI 진입점
+- 라우트가 DB/HTTP 대기 위주이므로 스레드 워커로 동시 요청 처리
+- 실행 예: gunicorn wsgi:app (워커/스레드 설정은 gunicorn.conf.py)
+"""
+
+from app import create_app
+
+app = create_app()